@@ -1,36 +1,18 @@
-import pandas as pd
-from src.data_loader import DataLoader
-from src.validator import DataValidator
-from src.transformer import DataTransformer
-from src.analyzer import ClimateAnalyzer
-
-
-def run_climate_analysis():
-    loader = DataLoader()
-    validator = DataValidator()
-    transformer = DataTransformer()
-    analyzer = ClimateAnalyzer()
+from pathlib import Path
 
-    # 1. Load raw data
-    raw_data = loader.load_all()
-
-    # 2. Validate datasets
-    validation_reports = validator.validate_data(raw_data)
+import pandas as pd
+from src.pipeline import run_climate_analysis as _run_pipeline
 
-    # 3. Transform data (monthly/seasonal/crop/resilience aggregates)
-    transformed_data = transformer.transform(raw_data)
 
-    # 4. Analyze and capture results
-    results = analyzer.analyze(transformed_data)
+def run_climate_analysis(cache_dir: Path = None):
+    # 1-4. Load, validate, transform and analyze
+    outputs = _run_pipeline(data_path=Path("data/raw"), cache_dir=cache_dir)
+    validation_reports = outputs["validation_reports"]
+    results = outputs["results"]
 
     # 5. Export everything to Excel
     with pd.ExcelWriter("climate_analysis_results.xlsx") as writer:
-        # Existing transformed data sheets
-        transformed_data["monthly"].to_excel(writer, sheet_name="Monthly", index=False)
-        transformed_data["seasonal"].to_excel(writer, sheet_name="Seasonal", index=False)
-        transformed_data["crop"].to_excel(writer, sheet_name="Crop", index=False)
-
-        # New sheets from analyzer results
+        # Sheets from analyzer results
         # a. Resilience scores
         resilience_df = pd.DataFrame(results["resilience"].items(),
                                      columns=["Region_Metric", "Score"])
@@ -50,9 +32,9 @@ def run_climate_analysis():
         crop_stress_df.to_excel(writer, sheet_name="Crop_Stress", index=False)
 
         # e. Recommendations
-        recommendation_df = pd.DataFrame.from_dict(results["recommendations"], orient="index")
-        recommendation_df.reset_index(inplace=True)
-        recommendation_df.columns = ["Region", "Recommendations"]
+        recommendation_df = pd.DataFrame(
+            [(region, rec) for region, recs in results["recommendations"].items() for rec in recs],
+            columns=["Region", "Recommendation"])
         recommendation_df.to_excel(writer, sheet_name="Recommendations", index=False)
 
     # Optional: log summary
@@ -1,18 +1,122 @@
 """
 Climate data analysis module.
 """
+import operator
 import pandas as pd
 import numpy as np
+
+
+def _stress_fraction(mean_temp: np.ndarray, rainfall: np.ndarray) -> float:
+    """Fraction of days outside optimal growing conditions (20-30°C, >=5mm rain)"""
+    if mean_temp.size == 0:
+        return float('nan')
+    # NaN comparisons are False, so missing values count as stress days
+    optimal = (mean_temp >= 20) & (mean_temp <= 30) & (rainfall >= 5)
+    return 1.0 - np.count_nonzero(optimal) / optimal.size
+
+
+def _quantile(values: np.ndarray, q: float) -> float:
+    """Linearly interpolated q-th quantile of the non-NaN values (as np.nanquantile)"""
+    n_valid = values.size - np.count_nonzero(np.isnan(values))
+    if n_valid == 0:
+        return np.nan
+    # Selection is O(n) rather than a full sort; NaNs are partitioned to the end
+    position = q * (n_valid - 1)
+    lower = int(position)
+    upper = min(lower + 1, n_valid - 1)
+    selected = np.partition(values, [lower, upper])
+    return selected[lower] + (selected[upper] - selected[lower]) * (position - lower)
+
+
+def _linear_slope(values: np.ndarray) -> float:
+    """Least-squares slope of values against their index (as np.polyfit(..., 1)[0])"""
+    n = values.size
+    if n < 2:
+        return np.nan
+    # Closed form with the index centred on its mean: sum((x - x̄) * y) / sum((x - x̄)²),
+    # where the denominator for x = 0..n-1 is n(n² - 1)/12
+    centred = np.arange(n, dtype=np.float64) - (n - 1) / 2
+    return (centred @ values) / (n * (n * n - 1) / 12)
+
+
+def _exceedance_frequency(values: np.ndarray, q: float) -> float:
+    """Fraction of values strictly above their q-th quantile"""
+    threshold = _quantile(values, q)
+    return np.count_nonzero(values > threshold) / values.size
+
+
+def _exceedance_frequencies(columns: list, q: float) -> np.ndarray:
+    """_exceedance_frequency of each column, in one stacked pass where possible"""
+    n = columns[0].size if columns else 0
+    if n == 0 or any(c.size != n for c in columns):
+        return np.array([_exceedance_frequency(c, q) for c in columns])
+    matrix = np.column_stack(columns)
+    if np.isnan(matrix).any():
+        # Columns with gaps have their own valid counts, hence quantile positions
+        return np.array([_exceedance_frequency(c, q) for c in columns])
+    # Same selection and interpolation as _quantile, for every column at once
+    position = q * (n - 1)
+    lower = int(position)
+    upper = min(lower + 1, n - 1)
+    selected = np.partition(matrix, [lower, upper], axis=0)
+    thresholds = selected[lower] + (selected[upper] - selected[lower]) * (position - lower)
+    return np.count_nonzero(matrix > thresholds, axis=0) / n
+
+
+# Representative crop economics: area (ha), price (INR/qtl), yield (qtl/ha)
+_CROP = pd.DataFrame({
+    'crop':  ["Soybean", "Cotton", "Wheat", "Gram", "Paddy"],
+    'area':  [3000000, 2500000, 2000000, 1500000, 1800000],
+    'price': [4000, 6000, 2500, 5000, 2200],
+    'yield': [10, 8, 25, 8, 20],
+})
+_CROP['base_yield'] = _CROP['area'] * _CROP['yield']
+_CROP['base_revenue'] = _CROP['base_yield'] * _CROP['price']
+# Column arrays for the economic impact build, extracted once
+_CROP_NAMES = _CROP['crop'].to_numpy()
+_CROP_BASE_YIELD = _CROP['base_yield'].to_numpy()
+_CROP_BASE_REVENUE = _CROP['base_revenue'].to_numpy()
+
+# (short key, full name) of each analysed region
+REGIONS = (('mh', 'maharashtra'), ('mp', 'madhya_pradesh'))
+
+# Resilience indicators and the score penalty per unit of each
+_RESILIENCE_METRICS = ('precip_variability', 'precip_drought_frequency', 'temp_anomaly')
+_RESILIENCE_WEIGHTS = np.array([50, 100, 10], dtype=np.float64)
+# Indicator keys per region, in REGIONS order
+_RESILIENCE_KEYS = tuple(tuple(f'{short}_{metric}' for metric in _RESILIENCE_METRICS)
+                         for short, _ in REGIONS)
+
+# Yield change (%) applied to base revenue for each season classification
+_YIELD_IMPACT = {"Drought": -20, "Excess Rain": -10, "Normal": 0}
+
+# (results section, metric key template, comparison, threshold, recommendations)
+_REC_RULES = (
+    # Climate resilience recommendations
+    ('resilience', '{short}_resilience_score', operator.lt, 50,
+     ("Implement drought-resistant crop varieties",
+      "Develop water conservation infrastructure")),
+    # Infrastructure recommendations
+    ('infrastructure', '{short}_infrastructure_risk', operator.gt, 70,
+     ("Strengthen weather monitoring systems",
+      "Improve drainage infrastructure")),
+    # Crop-specific recommendations
+    ('crop_analysis', '{full}_kharif_stress', operator.gt, 30,
+     ("Consider shifting kharif sowing dates",
+      "Implement soil moisture conservation practices")),
+)
+
+
 class ClimateAnalyzer:
-    def __init__(self):
-        self.crop_info = {
-            "Soybean": {"area": 3000000, "price": 4000, "yield": 10},
-            "Cotton":  {"area": 2500000, "price": 6000, "yield": 8},
-            "Wheat":   {"area": 2000000, "price": 2500, "yield": 25},
-            "Gram":    {"area": 1500000, "price": 5000, "yield": 8},
-            "Paddy":   {"area": 1800000, "price": 2200, "yield": 20},
-        }
-        
+    crop_info = _CROP.set_index('crop')[['area', 'price', 'yield']].to_dict(orient='index')
+    
+    # Recommendation rules with the metric key resolved for each region
+    _REGION_RULES = {
+        short: tuple((section, template.format(short=short, full=full), compare, threshold, messages)
+                     for section, template, compare, threshold, messages in _REC_RULES)
+        for short, full in REGIONS
+    }
+    
     def analyze(self, data: dict) -> dict:
         """Perform climate data analysis"""
         print("Data received by analyzer:", data.keys())
@@ -41,59 +145,42 @@ class ClimateAnalyzer:
         
     def _analyze_resilience(self, resilience_data: dict) -> dict:
         """Analyze climate resilience indicators"""
-        analysis = {}
+        missing = [key for keys in _RESILIENCE_KEYS for key in keys if key not in resilience_data]
+        if missing:
+            raise KeyError(f"Missing resilience indicators: {', '.join(missing)}")
         
-        # Calculate resilience scores (0-100)
-        for region in ['mh', 'mp']:
-            score = 100
-            
-            # Rainfall variability penalty (higher variability = lower score)
-            var_penalty = resilience_data[f'{region}_precip_variability'] * 50
-            score -= var_penalty
-            
-            # Drought frequency penalty
-            drought_penalty = resilience_data[f'{region}_precip_drought_frequency'] * 100
-            score -= drought_penalty
-            
-            # Temperature anomaly penalty
-            temp_penalty = resilience_data[f'{region}_temp_anomaly'] * 10
-            score -= temp_penalty
-            
-            analysis[f'{region}_resilience_score'] = max(0, min(100, score))
-            
-        return analysis
+        # One row of indicators per region, in _RESILIENCE_METRICS order
+        indicators = np.array([[resilience_data[key] for key in keys] for keys in _RESILIENCE_KEYS],
+                              dtype=np.float64)
+        
+        # Resilience scores (0-100): penalize rainfall variability, drought
+        # frequency and temperature anomalies
+        scores = np.clip(100.0 - indicators @ _RESILIENCE_WEIGHTS, 0, 100)
+        
+        return {f'{short}_resilience_score': float(score) for (short, _), score in zip(REGIONS, scores)}
         
     def _assess_infrastructure(self, data: dict) -> dict:
         """Assess infrastructure vulnerability"""
-        assessment = {}
+        # Rainfall and temperature columns of every region, in REGIONS order
+        columns = []
+        for _, region_full in REGIONS:
+            precip_data = data['monthly'][f'{region_full}_precipitation_monthly']
+            temp_data = data['monthly'][f'{region_full}_temperature_monthly']
+            columns.append(precip_data['rainfall_mm'].to_numpy())
+            columns.append(temp_data['mean'].to_numpy())
+        
+        # Frequency of extreme events (>95th percentile) for every column at once
+        extreme_freq = _exceedance_frequencies(columns, 0.95).reshape(len(REGIONS), 2)
         
-        region_mapping = {
-            'mh': 'maharashtra',
-            'mp': 'madhya_pradesh'
+        # Infrastructure risk score (0-100): rainfall and temperature extremes
+        # weigh equally
+        risk_scores = (extreme_freq[:, 0] * 50) + (extreme_freq[:, 1] * 50)
+        
+        assessment = {
+            f'{region_short}_infrastructure_risk': min(100, float(risk) * 100)
+            for (region_short, _), risk in zip(REGIONS, risk_scores)
         }
         
-        for region_short, region_full in region_mapping.items():
-            # Analyze extreme weather patterns
-            precip_data = data['monthly'][f'{region_full}_precipitation_monthly']
-            temp_data = data['monthly'][f'{region_full}_temperature_monthly']
-            
-            # Get the values from DataFrames
-            precip_rainfall = precip_data['rainfall_mm']
-            temp_mean = temp_data['mean']
-            
-            # Count extreme rainfall events (>95th percentile)
-            extreme_rain_threshold = float(precip_rainfall.quantile(0.95))
-            extreme_rain_freq = float((precip_rainfall > extreme_rain_threshold).mean())
-            
-            # Count extreme temperature events
-            extreme_temp_threshold = float(temp_mean.quantile(0.95))
-            extreme_temp_freq = float((temp_mean > extreme_temp_threshold).mean())
-            
-            # Infrastructure risk score (0-100)
-            risk_score = (extreme_rain_freq * 50) + (extreme_temp_freq * 50)
-            
-            assessment[f'{region_short}_infrastructure_risk'] = min(100, risk_score * 100)
-            
         return assessment
         
     def _analyze_crops(self, crop_data: dict) -> dict:
@@ -101,15 +188,11 @@ class ClimateAnalyzer:
         analysis = {}
         
         for region_season, data in crop_data.items():
-            # Calculate optimal growing conditions
-            optimal_temp = (data['mean'] >= 20) & (data['mean'] <= 30)
-            adequate_rain = data['rainfall_mm'] >= 5  # daily minimum
-            
-            # Calculate stress days
-            optimal_temp = optimal_temp.fillna(False)  # Handle any NaN values
-            adequate_rain = adequate_rain.fillna(False)
-            stress_days = optimal_temp.eq(False) | adequate_rain.eq(False)
-            stress_percentage = float(stress_days.mean() * 100)
+            stress_frac = _stress_fraction(
+                data['mean'].to_numpy(),
+                data['rainfall_mm'].to_numpy()
+            )
+            stress_percentage = float(stress_frac * 100)
             
             analysis[f'{region_season}_stress'] = stress_percentage
             
@@ -119,31 +202,12 @@ class ClimateAnalyzer:
         """Generate region-specific recommendations"""
         recommendations = {}
         
-        region_mapping = {
-            'mh': 'maharashtra',
-            'mp': 'madhya_pradesh'
-        }
-        
-        for region_short, region_full in region_mapping.items():
+        for region_short, rules in self._REGION_RULES.items():
             region_recs = []
             
-            # Climate resilience recommendations
-            resilience_score = float(results['resilience'][f'{region_short}_resilience_score'])
-            if resilience_score < 50:
-                region_recs.append("Implement drought-resistant crop varieties")
-                region_recs.append("Develop water conservation infrastructure")
-            
-            # Infrastructure recommendations
-            infra_risk = float(results['infrastructure'][f'{region_short}_infrastructure_risk'])
-            if infra_risk > 70:
-                region_recs.append("Strengthen weather monitoring systems")
-                region_recs.append("Improve drainage infrastructure")
-            
-            # Crop-specific recommendations
-            kharif_stress = float(results['crop_analysis'][f'{region_full}_kharif_stress'])
-            if kharif_stress > 30:
-                region_recs.append("Consider shifting kharif sowing dates")
-                region_recs.append("Implement soil moisture conservation practices")
+            for section, key, compare, threshold, messages in rules:
+                if compare(results[section][key], threshold):
+                    region_recs.extend(messages)
             
             recommendations[region_short] = region_recs
             
@@ -151,45 +215,49 @@ class ClimateAnalyzer:
     
     def _classify_seasons(self, seasonal_data: dict) -> dict:
         """Classify seasons based on rainfall patterns"""
+        labels = np.array(["Drought", "Excess Rain", "Normal"], dtype=object)
         classification = {}
-        for key, series in seasonal_data.items():
-            mean_rain = series.mean()
-            classification[key] = series.apply(
-                lambda x: "Drought" if float(x) < 0.8 * float(mean_rain)
-                else ("Excess Rain" if float(x) > 1.2 * float(mean_rain) else "Normal")
-            )
+        for name, series in seasonal_data.items():
+            vals = series.to_numpy(dtype=np.float64)
+            mean_rain = np.nanmean(vals)
+            codes = np.select([vals < 0.8 * mean_rain, vals > 1.2 * mean_rain], [0, 1], default=2)
+            classification[name] = pd.Series(labels[codes], index=series.index, name=series.name)
         return classification
     
     def _calculate_economic_impact(self, classification: dict) -> pd.DataFrame:
         """Calculate economic impact based on seasonal classification"""
-        impact_map = {"Drought": -20, "Excess Rain": -10, "Normal": 0}
+        columns = ['Region', 'Year', 'Season', 'Crop', 'Status',
+                   'Base_Yield(qtl)', 'Base_Revenue(INR)',
+                   'Estimated_Loss(INR)']
+        if not classification:
+            return pd.DataFrame(columns=columns)
         
-        loss_data = []
+        regions, seasons, lengths = [], [], []
         for region_key, status_series in classification.items():
             # Extract region and season from key
             region = region_key.split('_')[0]  # 'mh' or 'mp'
-            region = "Maharashtra" if region == "mh" else "Madhya Pradesh"
-            season = "Kharif" if "kharif" in region_key else "Rabi"
-            
-            for year in status_series.index:
-                status = status_series[year]
-                for crop, vals in self.crop_info.items():
-                    yield_loss_pct = impact_map[status]
-                    base_yield = vals['area'] * vals['yield']
-                    base_revenue = base_yield * vals['price']
-                    estimated_loss = (yield_loss_pct / 100) * base_revenue
-                    
-                    loss_data.append([
-                        region, year, season, crop, status,
-                        base_yield, base_revenue, estimated_loss
-                    ])
-        
-        return pd.DataFrame(
-            loss_data,
-            columns=['Region', 'Year', 'Season', 'Crop', 'Status',
-                    'Base_Yield(qtl)', 'Base_Revenue(INR)',
-                    'Estimated_Loss(INR)']
-        )
+            regions.append("Maharashtra" if region == "mh" else "Madhya Pradesh")
+            seasons.append("Kharif" if "kharif" in region_key else "Rabi")
+            lengths.append(len(status_series))
+        
+        years = np.concatenate([s.index.to_numpy() for s in classification.values()]).astype(np.int64)
+        statuses = np.concatenate([s.to_numpy() for s in classification.values()])
+        yield_loss_pct = pd.Series(statuses).map(_YIELD_IMPACT).to_numpy(dtype=np.float64)
+        
+        # One row per (region, season, year, crop), in classification order:
+        # status-level columns repeat per crop, crop-level columns tile per status
+        n_crops = _CROP_NAMES.size
+        rows_per_key = np.array(lengths) * n_crops
+        return pd.DataFrame({
+            'Region': np.repeat(np.array(regions, dtype=object), rows_per_key),
+            'Year': np.repeat(years, n_crops),
+            'Season': np.repeat(np.array(seasons, dtype=object), rows_per_key),
+            'Crop': np.tile(_CROP_NAMES, len(statuses)),
+            'Status': np.repeat(statuses, n_crops),
+            'Base_Yield(qtl)': np.tile(_CROP_BASE_YIELD, len(statuses)),
+            'Base_Revenue(INR)': np.tile(_CROP_BASE_REVENUE, len(statuses)),
+            'Estimated_Loss(INR)': np.outer(yield_loss_pct / 100, _CROP_BASE_REVENUE).ravel(),
+        }, columns=columns, copy=False)
     
     def _calculate_climate_indicators(self, monthly_data: dict) -> dict:
         """Calculate climate resilience indicators"""
@@ -197,7 +265,7 @@ class ClimateAnalyzer:
         
         for key, series in monthly_data.items():
             indicators[f"{key}_variability"] = series.std() / series.mean()  # CV
-            indicators[f"{key}_trend"] = np.polyfit(
-                np.arange(len(series)), series.values, 1)[0]  # Linear trend
+            indicators[f"{key}_trend"] = _linear_slope(
+                series.to_numpy(dtype=np.float64))  # Linear trend
         
         return indicators
@@ -1,31 +1,45 @@
 """
 Data loading and validation module.
 """
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+# Bumped whenever _parse_csv output changes, so stale pickles are not reused
+_CACHE_VERSION = 2
+
+# Output key -> source file; the order is the order the data is reported in
+DATA_FILES = {
+    'maharashtra_precipitation': 'MH_precipitation.csv',
+    'maharashtra_temperature': 'MH_temperature.csv',
+    'madhya_pradesh_precipitation': 'MP_precipitation.csv',
+    'madhya_pradesh_temperature': 'MP_temperature.csv'
+}
+
 class DataLoader:
-    def __init__(self, data_path: Path):
+    def __init__(self, data_path: Path, cache_dir: Path = None):
+        """Load the CSV files in data_path, pickling parsed frames in cache_dir if given"""
         self.data_path = data_path
+        self.cache_dir = cache_dir
         
     def load_all(self) -> dict:
         """Load all climate data files"""
         try:
-            data = {}
-            # Load Maharashtra data
-            mh_precip = self._load_csv('MH_precipitation.csv')
-            mh_temp = self._load_csv('MH_temperature.csv')
-            # Load Madhya Pradesh data
-            mp_precip = self._load_csv('MP_precipitation.csv')
-            mp_temp = self._load_csv('MP_temperature.csv')
+            # Read the files concurrently; the C parser releases the GIL, so
+            # the disk reads and parses overlap. Results and each file's
+            # warnings are collected in DATA_FILES order with consistent keys
+            logs = {key: [] for key in DATA_FILES}
+            with ThreadPoolExecutor(max_workers=len(DATA_FILES)) as executor:
+                futures = {
+                    key: executor.submit(self._load_csv, filename, logs[key])
+                    for key, filename in DATA_FILES.items()
+                }
+                data = {key: future.result() for key, future in futures.items()}
             
-            # Store with consistent keys
-            data = {
-                'maharashtra_precipitation': mh_precip,
-                'maharashtra_temperature': mh_temp,
-                'madhya_pradesh_precipitation': mp_precip,
-                'madhya_pradesh_temperature': mp_temp
-            }
+            for log in logs.values():
+                for line in log:
+                    print(line)
             
             print("Data loaded successfully:")
             for key, df in data.items():
@@ -36,34 +50,84 @@ class DataLoader:
         except Exception as e:
             raise RuntimeError(f"Error loading data: {str(e)}")
     
-    def _load_csv(self, filename: str) -> pd.DataFrame:
+    def _load_csv(self, filename: str, log: list = None) -> pd.DataFrame:
         """Load and basic preprocessing of CSV files"""
         try:
             file_path = self.data_path / filename
             if not file_path.exists():
                 raise FileNotFoundError(f"Data file not found: {filename}")
-                
-            # Read CSV with specific data types
-            df = pd.read_csv(file_path)
-            
-            # Convert date column
-            try:
-                df['date'] = pd.to_datetime(df['date'])
-            except Exception as e:
-                raise ValueError(f"Error converting date column in {filename}: {str(e)}")
             
-            # Convert numeric columns based on file type
-            if 'precipitation' in filename:
-                df['rainfall_mm'] = pd.to_numeric(df['rainfall_mm'], errors='coerce')
-            elif 'temperature' in filename:
-                df['mean'] = pd.to_numeric(df['mean'], errors='coerce')
+            # Reuse the parsed frame pickled in the cache directory unless the
+            # CSV has been modified since
+            cache_path = self._cache_path(file_path)
+            if (cache_path is not None and cache_path.exists()
+                    and cache_path.stat().st_mtime > file_path.stat().st_mtime):
+                df = pd.read_pickle(cache_path)
+            else:
+                df = self._parse_csv(file_path)
+                if cache_path is not None:
+                    self._write_cache(df, cache_path)
                 
             # Check for missing values after conversion
             missing = df.isnull().sum()
             if missing.any():
-                print(f"Warning: Found {missing.sum()} missing values in {filename}")
+                warning = f"Warning: Found {missing.sum()} missing values in {filename}"
+                if log is None:
+                    print(warning)
+                else:
+                    log.append(warning)
                 
             return df
             
         except Exception as e:
             raise RuntimeError(f"Error loading {filename}: {str(e)}")
+    
+    def _cache_path(self, file_path: Path) -> Path:
+        """Pickle for a parsed CSV, stamped with the versions that can read it"""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / (f"{file_path.stem}.v{_CACHE_VERSION}"
+                                 f"-pandas{pd.__version__}-numpy{np.__version__}.pkl")
+    
+    def _write_cache(self, df: pd.DataFrame, cache_path: Path):
+        """Pickle a parsed frame, removing pickles of the same CSV from other versions"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_pickle(cache_path)
+            for stale in cache_path.parent.glob(f"{cache_path.name.split('.', 1)[0]}.*pkl"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+        except OSError:
+            # Read-only cache directory; parse again next time
+            pass
+    
+    def _parse_csv(self, file_path: Path) -> pd.DataFrame:
+        """Parse a raw CSV file into typed date and value columns"""
+        filename = file_path.name
+        # Parse dates and the value column in the C parser's single pass
+        # rather than converting the object columns afterwards. Readings are
+        # kept in float32, which every later step works in: the analyses
+        # compare them against coarse thresholds, and half the bytes halves
+        # the bandwidth of every downstream reduction
+        if 'precipitation' in filename:
+            value_col = 'rainfall_mm'
+        elif 'temperature' in filename:
+            value_col = 'mean'
+        else:
+            value_col = None
+        dtype = {value_col: np.float32} if value_col else None
+        try:
+            df = pd.read_csv(file_path, parse_dates=['date'], dtype=dtype)
+        except ValueError:
+            # Non-numeric entries; re-read and coerce them to NaN
+            df = pd.read_csv(file_path, parse_dates=['date'])
+            df[value_col] = pd.to_numeric(df[value_col], errors='coerce').astype(np.float32)
+        
+        # Dates the parser could not handle are left as strings
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            try:
+                df['date'] = pd.to_datetime(df['date'])
+            except Exception as e:
+                raise ValueError(f"Error converting date column in {filename}: {str(e)}")
+        
+        return df
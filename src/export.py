@@ -0,0 +1,30 @@
+"""
+Helpers shared by the result exports.
+"""
+import numpy as np
+import pandas as pd
+
+
+def widen_float32(data):
+    """Widen float32 values to float64 by their shortest decimal form (23.7, not 23.700000762939453)"""
+    if isinstance(data, pd.DataFrame):
+        columns = [col for col, dtype in data.dtypes.items() if dtype == np.float32]
+        if not columns:
+            return data
+        widened = data.copy(deep=False)
+        for col in columns:
+            widened[col] = widen_float32(data[col].to_numpy())
+        return widened
+    if isinstance(data, pd.Series):
+        if data.dtype != np.float32:
+            return data
+        return pd.Series(widen_float32(data.to_numpy()), index=data.index, name=data.name)
+    if isinstance(data, np.ndarray) and data.dtype == np.float32:
+        # Readings repeat heavily, so each distinct value is formatted once
+        codes, uniques = pd.factorize(data.ravel())
+        widened = uniques.astype(str).astype(np.float64)[codes]
+        widened[codes < 0] = np.nan
+        return widened.reshape(data.shape)
+    if isinstance(data, np.float32):
+        return float(str(data))
+    return data
@@ -1,15 +1,25 @@
 """
 Core pipeline implementation for climate data analysis.
 """
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
+import numpy as np
 import pandas as pd
 from .data_loader import DataLoader
+from .export import widen_float32
 from .transformer import DataTransformer
 from .analyzer import ClimateAnalyzer
 from .validator import DataValidator
 from .resilience import ResilienceAnalyzer
 
+# Region names used in the economic impact table
+_REGION_NAMES = {'mh': 'Maharashtra', 'mp': 'Madhya Pradesh'}
+
+# Bumped whenever the loaded or transformed data change (columns, dtypes or
+# values), so caches written by older code are not reused
+_CACHE_VERSION = 2
+
 class ClimateDataPipeline:
     def __init__(self, data_path: Path = None, output_path: Path = None):
         self.data_path = data_path or Path("data/raw")
@@ -78,8 +88,9 @@ class ClimateDataPipeline:
             'mp': 'madhya_pradesh'
         }
         for region_short, region_full in region_mapping.items():
-            rainfall = processed_data['monthly'][f'{region_full}_precipitation_monthly']
-            temperature = processed_data['monthly'][f'{region_full}_temperature_monthly']
+            # Score the value columns; the monthly frames also carry dates
+            rainfall = processed_data['monthly'][f'{region_full}_precipitation_monthly']['rainfall_mm']
+            temperature = processed_data['monthly'][f'{region_full}_temperature_monthly']['mean']
             
             score = self.resilience.calculate_resilience_score(rainfall, temperature)
             strategies = self.resilience.get_adaptation_strategies(score)
@@ -114,29 +125,36 @@ class ClimateDataPipeline:
         output_dir = self.output_path
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save monthly data
-        for key, series in data['monthly'].items():
-            series.to_csv(output_dir / f"{key}_monthly.csv")
-        
-        # Save seasonal data
-        for key, series in data['seasonal'].items():
-            series.to_csv(output_dir / f"{key}_seasonal.csv")
+        # Save monthly and seasonal data; the files are independent, so
+        # format and write them concurrently
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(series.to_csv, output_dir / f"{key}_{period}.csv")
+                for period in ('monthly', 'seasonal')
+                for key, series in data[period].items()
+            ]
+            for future in futures:
+                future.result()
     
     def _save_results(self, results: dict):
         """Save analysis results"""
         output_dir = self.output_path
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save results as JSON
-        with open(output_dir / "analysis_results.json", 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        # Save results as JSON; encoding to one string in the C encoder and
+        # writing it once is faster than json.dump's chunked writes
+        payload = json.dumps(results, indent=2, default=_json_default)
+        (output_dir / "analysis_results.json").write_text(payload)
     
-    def _get_economic_recommendations(self, economic_data: dict, region: str) -> list:
+    def _get_economic_recommendations(self, economic_data: pd.DataFrame, region: str) -> list:
         """Generate economic recommendations"""
         recs = []
-        impact_data = [d for d in economic_data if d['Region'].lower() == region]
+        # Column-wise mask over the impact table rather than a per-row loop
+        region_name = _REGION_NAMES[region]
+        losses = economic_data['Estimated_Loss(INR)'].to_numpy()
+        in_region = economic_data['Region'].to_numpy() == region_name
         
-        if any(d['Estimated_Loss'] < -1000000 for d in impact_data):
+        if np.any(losses[in_region] < -1000000):
             recs.extend([
                 "Implement crop insurance schemes",
                 "Develop alternative income sources",
@@ -169,3 +187,91 @@ class ClimateDataPipeline:
                 "Implement soil moisture conservation"
             ])
         return recs
+
+
+def run_climate_analysis(data_path: Path = None, cache_dir: Path = None) -> dict:
+    """Load, validate, transform and analyze the climate data, caching in cache_dir if given"""
+    data_path = data_path or Path("data/raw")
+    transformed_cache = None
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        transformed_cache = _cache_file(cache_dir, "transformed")
+    
+    data = DataLoader(data_path, cache_dir).load_all()
+    validation_reports = DataValidator().validate_data(data)
+    
+    transformed_data = _read_cache(transformed_cache, data_path)
+    if transformed_data is None:
+        transformed_data = _aggregate(data)
+        _write_cache(transformed_cache, transformed_data)
+    
+    results = ClimateAnalyzer().analyze(transformed_data)
+    
+    return {
+        'validation_reports': validation_reports,
+        'transformed': transformed_data,
+        'results': results
+    }
+
+def _aggregate(data: dict) -> dict:
+    """Compute the monthly, seasonal, resilience and crop aggregates"""
+    # Coerce the date columns before any worker starts: the monthly
+    # aggregation would otherwise assign them on the shared frames while the
+    # others read them. After this the aggregations only read the loaded
+    # frames, so the independent ones run concurrently; seasonal aggregates
+    # depend on the monthly result
+    for df in data.values():
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            df['date'] = pd.to_datetime(df['date'])
+    transformer = DataTransformer()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        monthly_future = executor.submit(transformer._calculate_monthly_aggregates, data)
+        resilience_future = executor.submit(transformer._calculate_resilience_indicators, data)
+        crop_future = executor.submit(transformer._transform_crop_data, data)
+        monthly = monthly_future.result()
+        return {
+            'monthly': monthly,
+            'seasonal': transformer._calculate_seasonal_aggregates(monthly),
+            'resilience': resilience_future.result(),
+            'crop': crop_future.result()
+        }
+
+def _json_default(obj):
+    """Convert pandas and NumPy objects for JSON encoding"""
+    if isinstance(obj, pd.DataFrame):
+        return widen_float32(obj).to_dict(orient='records')
+    if isinstance(obj, pd.Series):
+        # JSON object keys must be strings (dates, years, ...)
+        return {str(k): v for k, v in widen_float32(obj).items()}
+    if isinstance(obj, np.ndarray):
+        if np.issubdtype(obj.dtype, np.datetime64):
+            return np.datetime_as_string(obj, unit='s').tolist()
+        return widen_float32(obj).tolist()
+    if isinstance(obj, np.float32):
+        return widen_float32(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+def _cache_file(cache_dir: Path, name: str) -> Path:
+    """Cache file for name, stamped with the versions that can read it back"""
+    return cache_dir / f"{name}.v{_CACHE_VERSION}-pandas{pd.__version__}-numpy{np.__version__}.pkl"
+
+def _read_cache(cache_file: Path, data_path: Path):
+    """Return the cached object if it is newer than all raw CSV files"""
+    if cache_file is None or not cache_file.exists():
+        return None
+    cache_mtime = cache_file.stat().st_mtime
+    if any(f.stat().st_mtime > cache_mtime for f in data_path.glob("*.csv")):
+        return None
+    return pd.read_pickle(cache_file)
+
+def _write_cache(cache_file: Path, obj):
+    """Pickle an object to the cache, if caching is enabled"""
+    if cache_file is not None:
+        pd.to_pickle(obj, cache_file)
+        # Drop files for the same name written under other versions
+        name = cache_file.name.split('.', 1)[0]
+        for stale in cache_file.parent.glob(f"{name}.*pkl"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
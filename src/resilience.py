@@ -22,12 +22,23 @@ class ResilienceAnalyzer:
     
     def _rainfall_resilience(self, rainfall: pd.Series) -> float:
         """Calculate rainfall-based resilience score"""
-        mean_rain = rainfall.mean()
+        values = np.asarray(rainfall, dtype=np.float64)
+        observed = values[~np.isnan(values)]
         
-        # Calculate various indicators
-        variability = rainfall.std() / mean_rain
-        drought_freq = (rainfall < (self.thresholds['drought_threshold'] * mean_rain)).mean()
-        excess_freq = (rainfall > (self.thresholds['excess_threshold'] * mean_rain)).mean()
+        # One sum for the mean, one dot product for the sample variance, and
+        # the threshold counts on the same array; missing days never satisfy
+        # a threshold but still count towards the frequencies
+        if observed.size:
+            mean_rain = observed.sum() / observed.size
+            deviations = observed - mean_rain
+            std = np.sqrt(deviations @ deviations / (observed.size - 1)) if observed.size > 1 else np.nan
+            
+            # Calculate various indicators
+            variability = std / mean_rain
+            drought_freq = np.count_nonzero(observed < self.thresholds['drought_threshold'] * mean_rain) / values.size
+            excess_freq = np.count_nonzero(observed > self.thresholds['excess_threshold'] * mean_rain) / values.size
+        else:
+            variability = drought_freq = excess_freq = np.nan
         
         # Convert to 0-100 score
         score = 100
@@ -39,9 +50,15 @@ class ResilienceAnalyzer:
     
     def _temperature_resilience(self, temperature: pd.Series) -> float:
         """Calculate temperature-based resilience score"""
-        # Calculate stress days
-        high_stress = (temperature > self.thresholds['temp_stress_high']).mean()
-        low_stress = (temperature < self.thresholds['temp_stress_low']).mean()
+        values = np.asarray(temperature, dtype=np.float64)
+        
+        # Calculate stress days; both counts come from the same array and
+        # missing days (never stressed) still count towards the frequencies
+        if values.size:
+            high_stress = np.count_nonzero(values > self.thresholds['temp_stress_high']) / values.size
+            low_stress = np.count_nonzero(values < self.thresholds['temp_stress_low']) / values.size
+        else:
+            high_stress = low_stress = np.nan
         
         # Convert to 0-100 score
         score = 100
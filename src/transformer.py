@@ -1,8 +1,84 @@
 """
 Data transformation module for climate analysis.
 """
+import logging
+import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+# Season membership indexed by month number (0 marks a missing date):
+# Kharif is June-October, Rabi November-March
+KHARIF_MASK = np.zeros(13, dtype=bool)
+KHARIF_MASK[[6, 7, 8, 9, 10]] = True
+RABI_MASK = np.zeros(13, dtype=bool)
+RABI_MASK[[11, 12, 1, 2, 3]] = True
+
+# Short region code and kind of each dataset key, e.g.
+# 'madhya_pradesh_temperature' -> ('mp', 'temperature')
+_DATASET_KEYS = {
+    f'{region}_{kind}': (short_region, kind)
+    for region, short_region in (('maharashtra', 'mh'), ('madhya_pradesh', 'mp'))
+    for kind in ('precipitation', 'temperature')
+}
+
+
+def _month_key(dates: pd.Series) -> np.ndarray:
+    """Calendar month of each date, for use as a groupby key"""
+    if isinstance(dates.dtype, pd.DatetimeTZDtype):
+        # Months of the local wall time rather than of UTC
+        dates = dates.dt.tz_localize(None)
+    return dates.to_numpy().astype('datetime64[M]')
+
+
+def _calendar_fields(dates: pd.Series) -> tuple:
+    """Month (1-12, 0 where the date is missing) and year of each date"""
+    # Both fields from one datetime64[M] cast; years stay int32, as from
+    # dt.year, since they label the seasonal aggregates
+    months = _month_key(dates)
+    offset = months.astype(np.int64)  # months since 1970-01
+    month = (offset % 12 + 1).astype(np.int8)
+    year = (offset // 12 + 1970).astype(np.int32)
+    month[np.isnat(months)] = 0
+    return month, year
+
+
+def _aligned_dates(left: pd.Series, right: pd.Series) -> bool:
+    """Whether two date columns hold the same strictly increasing dates"""
+    # Rows of such frames pair up by position exactly as an inner merge on
+    # date would pair them (NaT never compares as increasing)
+    left, right = left.to_numpy(), right.to_numpy()
+    return (left.dtype == right.dtype and np.array_equal(left, right)
+            and bool(np.all(left[1:] > left[:-1])))
+
+
+def _monthly_mean(df: pd.DataFrame, value_col: str) -> pd.DataFrame:
+    """Month-end mean of a column (as groupby(pd.Grouper(key='date', freq='ME')))"""
+    # Bin each row by its month offset from the first month and accumulate
+    # sums and counts with bincount; months without data come out as NaN
+    months = _month_key(df['date'])
+    values = df[value_col].to_numpy()
+    dtype = values.dtype if values.dtype.kind == 'f' else np.dtype(np.float64)
+    tz = getattr(df['date'].dtype, 'tz', None)
+    dated = ~np.isnat(months)
+    if not dated.any():
+        return pd.DataFrame({'date': pd.DatetimeIndex([], tz=tz),
+                             value_col: pd.Series(dtype=dtype)})
+    
+    first, last = months[dated].min(), months[dated].max()
+    n_months = int((last - first).astype(np.int64)) + 1
+    observed = dated & ~np.isnan(values.astype(dtype, copy=False))
+    bins = (months[observed] - first).astype(np.int64)
+    sums = np.bincount(bins, weights=values[observed], minlength=n_months)
+    counts = np.bincount(bins, minlength=n_months)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        values = (sums / counts).astype(dtype)
+    
+    months = np.arange(first, last + 1)
+    month_end = pd.DatetimeIndex((months + 1).astype('datetime64[ns]') - np.timedelta64(1, 'D'))
+    return pd.DataFrame({'date': month_end.tz_localize(tz), value_col: values})
+
+
 class DataTransformer:
     def transform(self, data: dict) -> dict:
         """Transform raw data into analysis-ready format"""
@@ -12,67 +88,61 @@ class DataTransformer:
         transformed = {}
         
         try:
-            print("Starting monthly aggregates...")
+            logger.debug("Starting monthly aggregates...")
             transformed['monthly'] = self._calculate_monthly_aggregates(data)
-            print("Monthly aggregates keys:", transformed['monthly'].keys())
+            logger.debug("Monthly aggregates keys: %s", transformed['monthly'].keys())
             
-            print("Starting seasonal aggregates...")
+            logger.debug("Starting seasonal aggregates...")
             transformed['seasonal'] = self._calculate_seasonal_aggregates(data)
-            print("Seasonal aggregates keys:", transformed['seasonal'].keys())
+            logger.debug("Seasonal aggregates keys: %s", transformed['seasonal'].keys())
             
-            print("Starting resilience calculations...")
-            transformed['resilience'] = self._calculate_resilience_indicators(data)
-            print("Resilience indicators keys:", transformed['resilience'].keys())
+            logger.debug("Starting resilience calculations...")
+            transformed['resilience'] = self._calculate_resilience_indicators(
+                data, seasonal=transformed['seasonal'])
+            logger.debug("Resilience indicators keys: %s", transformed['resilience'].keys())
             
-            print("Starting crop transformations...")
+            logger.debug("Starting crop transformations...")
             transformed['crop'] = self._transform_crop_data(data)
-            print("Crop data keys:", transformed['crop'].keys())
-            print("Crop data content:", [f"{k}: {len(v)} rows" for k, v in transformed['crop'].items()])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Crop data keys: %s", transformed['crop'].keys())
+                logger.debug("Crop data content: %s",
+                             [f"{k}: {len(v)} rows" for k, v in transformed['crop'].items()])
             
-            print("All transformations completed successfully")
+            logger.debug("All transformations completed successfully")
             
         except Exception as e:
             raise RuntimeError(f"Error during data transformation: {str(e)}")
             
         return transformed
         
-    def _calculate_resilience_indicators(self, data: dict) -> dict:
-        """Calculate climate resilience indicators"""
+    def _calculate_resilience_indicators(self, data: dict, seasonal: dict = None) -> dict:
+        """Calculate climate resilience indicators, reusing the seasonal aggregates if given"""
         indicators = {}
         
-        region_mapping = {
-            'maharashtra': 'mh',
-            'madhya_pradesh': 'mp'
-        }
-
         for key, df in data.items():
-            print(f"Processing resilience for key: {key}")
-            if 'precipitation' in key:
-                # Fix to handle multi-word regions
-                region = key[:key.find('_precipitation')]
-                print(f"Extracted region: {region}")
-                short_region = region_mapping[region]
-                
-                # Calculate rainfall variability
-                monthly_stats = df.groupby(pd.Grouper(key='date', freq='ME'))['rainfall_mm'].agg(['mean', 'std'])
+            logger.debug("Processing resilience for key: %s", key)
+            short_region, kind = _DATASET_KEYS.get(key, (None, None))
+            logger.debug("Extracted region: %s", short_region)
+            if kind == 'precipitation':
+                # Calculate rainfall variability; months without data have no
+                # group here, as their all-NaN Grouper bins would be skipped
+                monthly_stats = df['rainfall_mm'].groupby(_month_key(df['date'])).agg(['mean', 'std'])
                 rain_var = (monthly_stats['std'] / monthly_stats['mean']).mean()
                 indicators[f"{short_region}_precip_variability"] = float(rain_var)
                 
-                # Calculate drought frequency
-                seasonal = self._calculate_seasonal_aggregates({key: df})
-                first_key = list(seasonal.keys())[0]
-                mean_rain = seasonal[first_key].mean()
-                drought_freq = (seasonal[first_key] < 0.8 * mean_rain).mean()
+                # Calculate drought frequency from the kharif aggregates
+                kharif_key = f"{short_region}_kharif"
+                if seasonal is not None and kharif_key in seasonal:
+                    kharif = seasonal[kharif_key]
+                else:
+                    kharif = self._calculate_seasonal_aggregates({key: df})[kharif_key]
+                mean_rain = kharif.mean()
+                drought_freq = (kharif < 0.8 * mean_rain).mean()
                 indicators[f"{short_region}_precip_drought_frequency"] = float(drought_freq)
             
-            elif 'temperature' in key:
-                # Fix to handle multi-word regions
-                region = key[:key.find('_temperature')]
-                print(f"Extracted region: {region}")
-                short_region = region_mapping[region]
-                
+            elif kind == 'temperature':
                 # Calculate temperature anomalies
-                monthly_means = df.groupby(pd.Grouper(key='date', freq='ME'))['mean'].mean()
+                monthly_means = df['mean'].groupby(_month_key(df['date'])).mean()
                 baseline = monthly_means.mean()
                 temp_anomaly = abs(monthly_means - baseline).mean()
                 indicators[f"{short_region}_temp_anomaly"] = float(temp_anomaly)
@@ -88,31 +158,54 @@ class DataTransformer:
             'mh': 'maharashtra',
             'mp': 'madhya_pradesh'
         }
-        for region_short, region_full in region_mapping.items():
-            precip_df = data[f'{region_full}_precipitation']
-            temp_df = data[f'{region_full}_temperature']
-            
-            print(f"Merging data for {region_full}")
-            merged = pd.merge(
-                precip_df, 
-                temp_df[['date', 'mean']], 
-                on='date', 
+        regions = list(region_mapping.values())
+        
+        # One join over all regions, tagged with their position in regions,
+        # instead of a merge per region
+        logger.debug("Merging data for %s", ', '.join(regions))
+        precip = [data[f'{region}_precipitation'] for region in regions]
+        temp = [data[f'{region}_temperature'] for region in regions]
+        if all('mean' not in p.columns and _aligned_dates(p['date'], t['date'])
+               for p, t in zip(precip, temp)):
+            # Same daily dates in the same order: the join is a column copy
+            merged_all = pd.concat(
+                [p.assign(region=code, mean=t['mean'].to_numpy())
+                 for code, (p, t) in enumerate(zip(precip, temp))],
+                ignore_index=True)
+        else:
+            precip_all = pd.concat(
+                [p.assign(region=code) for code, p in enumerate(precip)],
+                ignore_index=True)
+            temp_all = pd.concat(
+                [t[['date', 'mean']].assign(region=code) for code, t in enumerate(temp)],
+                ignore_index=True)
+            merged_all = pd.merge(
+                precip_all,
+                temp_all,
+                on=['region', 'date'],
+                how='inner',
                 suffixes=('_rain', '_temp')
             )
-            print(f"Columns after merge: {merged.columns}")
-            
-            # Calculate growing season conditions
-            merged['month'] = merged['date'].dt.month
-            
-            # Kharif season (June-October)
-            kharif = merged[merged['month'].isin([6,7,8,9,10])]
-            
-            # Rabi season (November-March)
-            rabi = merged[merged['month'].isin([11,12,1,2,3])]
+        region_codes = merged_all.pop('region').to_numpy()
+        logger.debug("Columns after merge: %s", merged_all.columns)
+        
+        # Calculate growing season conditions
+        merged_all['month'], _ = _calendar_fields(merged_all['date'])
+        
+        # Kharif season (June-October)
+        kharif_mask = KHARIF_MASK[merged_all['month'].to_numpy()]
+        
+        # Rabi season (November-March)
+        rabi_mask = RABI_MASK[merged_all['month'].to_numpy()]
+        
+        for code, region_full in enumerate(regions):
+            # Rows of this region, indexed as its own merge would be
+            in_region = region_codes == code
+            merged = merged_all[in_region].reset_index(drop=True)
             
-            print(f"Adding crop data for region: {region_full}")
-            crop_data[f'{region_full}_kharif'] = kharif
-            crop_data[f'{region_full}_rabi'] = rabi
+            logger.debug("Adding crop data for region: %s", region_full)
+            crop_data[f'{region_full}_kharif'] = merged[kharif_mask[in_region]]
+            crop_data[f'{region_full}_rabi'] = merged[rabi_mask[in_region]]
         
         return crop_data
     
@@ -125,15 +218,11 @@ class DataTransformer:
                 if not pd.api.types.is_datetime64_any_dtype(df['date']):
                     df['date'] = pd.to_datetime(df['date'])
                     
-                print(f"Processing monthly data for key: {key}")
+                logger.debug("Processing monthly data for key: %s", key)
                 if 'precipitation' in key:
-                    monthly_series = df.groupby(
-                        pd.Grouper(key='date', freq='ME'))['rainfall_mm'].mean()
-                    monthly[f"{key}_monthly"] = monthly_series.to_frame().reset_index()
+                    monthly[f"{key}_monthly"] = _monthly_mean(df, 'rainfall_mm')
                 elif 'temperature' in key:
-                    monthly_series = df.groupby(
-                        pd.Grouper(key='date', freq='ME'))['mean'].mean()
-                    monthly[f"{key}_monthly"] = monthly_series.to_frame().reset_index()
+                    monthly[f"{key}_monthly"] = _monthly_mean(df, 'mean')
         except Exception as e:
             raise ValueError(f"Error in monthly aggregation: {str(e)}")
         return monthly
@@ -143,15 +232,18 @@ class DataTransformer:
         seasonal = {}
         for key, df in data.items():
             if 'precipitation' in key:
-                df = df.copy()
-                df['month'] = df['date'].dt.month
-                df['year'] = df['date'].dt.year
+                # Group plain arrays on the calendar keys; the source frame is
+                # neither copied nor given helper columns
+                month, year = _calendar_fields(df['date'])
+                rainfall = df['rainfall_mm'].to_numpy()
                 
                 # Kharif season (June-October)
-                kharif = df[df['month'].isin([6,7,8,9,10])].groupby('year')['rainfall_mm'].mean()
+                in_kharif = KHARIF_MASK[month]
+                kharif = self._seasonal_mean(rainfall[in_kharif], year[in_kharif])
                 
                 # Rabi season (November-March)
-                rabi = df[df['month'].isin([11,12,1,2,3])].groupby('year')['rainfall_mm'].mean()
+                in_rabi = RABI_MASK[month]
+                rabi = self._seasonal_mean(rainfall[in_rabi], year[in_rabi])
                 
                 region = key.split('_')[0]
                 region_short = 'mh' if region == 'maharashtra' else 'mp'
@@ -159,3 +251,9 @@ class DataTransformer:
                 seasonal[f"{region_short}_rabi"] = rabi
         
         return seasonal
+    
+    @staticmethod
+    def _seasonal_mean(rainfall: np.ndarray, year: np.ndarray) -> pd.Series:
+        """Mean rainfall per year, indexed by 'year'"""
+        means = pd.Series(rainfall, name='rainfall_mm', copy=False).groupby(year).mean()
+        return means.rename_axis('year')
@@ -1,8 +1,59 @@
 """
 Data validation module for climate data.
 """
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
+from openpyxl import Workbook
+from .export import widen_float32
+
+# Columns whose values are summarized and range-checked
+VALUE_COLUMNS = ('rainfall_mm', 'mean')
+
+
+def _sample_std(observed: np.ndarray, mean) -> np.floating:
+    """Sample standard deviation (ddof=1) around an already computed mean"""
+    deviations = observed - mean
+    return np.sqrt(np.square(deviations, out=deviations).sum() / observed.dtype.type(observed.size - 1))
+
+
+def _summarize(values: np.ndarray) -> dict:
+    """Summary statistics of the non-missing values (pandas skipna semantics)"""
+    observed = values[~np.isnan(values)]
+    # Floating type of the statistics; integer columns have no NaN of their own
+    float_type = np.result_type(values.dtype, np.float32).type
+    if observed.size == 0:
+        nan = float_type(np.nan)
+        return {'count': 0, 'min': nan, 'max': nan, 'mean': nan, 'std': nan, 'median': nan, 'q95': np.nan}
+    # Median and 95th percentile from one selection pass, interpolated in
+    # double precision as pandas' quantile does
+    median, q95 = np.quantile(observed.astype(np.float64), [0.5, 0.95])
+    mean = observed.mean()
+    return {
+        'count': observed.size,
+        'min': observed.min(),
+        'max': observed.max(),
+        'mean': mean,
+        'std': _sample_std(observed, mean) if observed.size > 1 else float_type(np.nan),
+        'median': float_type(median),
+        'q95': q95
+    }
+
+
+def _append_records(workbook: Workbook, sheet_name: str, records: list):
+    """Write records as a table on a new sheet (as pd.DataFrame(records).to_excel)"""
+    worksheet = workbook.create_sheet(sheet_name)
+    # Columns in the order keys first appear; absent keys and missing values
+    # are left as empty cells
+    columns = list(dict.fromkeys(col for record in records for col in record))
+    if not columns:
+        return
+    worksheet.append(columns)
+    for record in records:
+        worksheet.append([None if pd.isna(value)
+                          else widen_float32(value) if isinstance(value, np.float32) else value
+                          for value in map(record.get, columns)])
+
 
 class DataValidator:
     def __init__(self):
@@ -21,39 +72,21 @@ class DataValidator:
         try:
             if not data:
                 raise ValueError("No data provided for validation")
-                
-            for key, df in data.items():
-                print(f"\nValidating {key}...")
-                
-                # Make a copy to avoid modifying original data
-                df_copy = df.copy()
-                
-                # Initial validation
-                report = self._validate_dataframe(df_copy, key)
-                
-                # Handle missing values if any
-                missing_values = df_copy.isnull().sum()
-                if missing_values.any():
-                    print(f"Found missing values in {key}:")
-                    for col, count in missing_values.items():
-                        if count > 0:
-                            print(f"  - {col}: {count} missing values")
-                            
-                    print("Attempting interpolation...")
-                    
-                    if 'rainfall_mm' in df_copy.columns:
-                        df_copy['rainfall_mm'] = df_copy['rainfall_mm'].interpolate(method='linear')
-                        df_copy['rainfall_mm'] = df_copy['rainfall_mm'].fillna(method='bfill').fillna(method='ffill')
-                        
-                    if 'mean' in df_copy.columns:
-                        df_copy['mean'] = df_copy['mean'].interpolate(method='linear')
-                        df_copy['mean'] = df_copy['mean'].fillna(method='bfill').fillna(method='ffill')
-                    
-                    # Re-validate after interpolation
-                    report = self._validate_dataframe(df_copy, key)
-                    
+            
+            # The datasets are independent, so they are validated concurrently
+            # (NumPy releases the GIL in the reductions). Each dataset's
+            # console lines are collected by its worker and printed together,
+            # and results are reported and stored in the order of data
+            with ThreadPoolExecutor(max_workers=len(data)) as executor:
+                futures = {
+                    key: executor.submit(self._validate_dataset, df, key)
+                    for key, df in data.items()
+                }
+                results = {key: future.result() for key, future in futures.items()}
+            
+            for key, (report, df_copy, log) in results.items():
+                print('\n'.join(log))
                 self.quality_reports[key] = report
-                print(f"Validation completed for {key}: {report['validation_status']}")
                 
                 # Update the original dataframe with cleaned data
                 data[key] = df_copy
@@ -63,24 +96,79 @@ class DataValidator:
         except Exception as e:
             raise RuntimeError(f"Error during data validation: {str(e)}")
     
-    def _validate_dataframe(self, df: pd.DataFrame, name: str) -> dict:
+    def _validate_dataset(self, df: pd.DataFrame, name: str) -> tuple:
+        """Validate one dataset, returning its report, cleaned copy and console lines"""
+        log = [f"\nValidating {name}..."]
+        
+        # Make a copy to avoid modifying original data
+        df_copy = df.copy()
+        
+        # Initial validation, sharing the missing value scan with the
+        # interpolation decision below
+        missing_check = self._check_missing_values(df_copy)
+        report = self._validate_dataframe(df_copy, name, missing_check, log=log)
+        
+        # Handle missing values if any
+        missing_values = missing_check['details']
+        if any(missing_values.values()):
+            log.append(f"Found missing values in {name}:")
+            log.extend(f"  - {col}: {count} missing values"
+                       for col, count in missing_values.items() if count > 0)
+            log.append("Attempting interpolation...")
+            
+            # Linear in between; leading and trailing gaps take the nearest value
+            if 'rainfall_mm' in df_copy.columns:
+                df_copy['rainfall_mm'] = df_copy['rainfall_mm'].interpolate(method='linear', limit_direction='both')
+                
+            if 'mean' in df_copy.columns:
+                df_copy['mean'] = df_copy['mean'].interpolate(method='linear', limit_direction='both')
+            
+            # Re-validate after interpolation, which only fills missing
+            # values: the date and type checks carry over
+            report = self._validate_dataframe(df_copy, name, previous=report, log=log)
+        
+        log.append(f"Validation completed for {name}: {report['validation_status']}")
+        return report, df_copy, log
+    
+    def _validate_dataframe(self, df: pd.DataFrame, name: str, missing_check: dict = None,
+                            previous: dict = None, log: list = None) -> dict:
         """Validate individual dataframe and return detailed report"""
         try:
+            # A report on the same dates and dtypes (before interpolation)
+            # carries its date and type checks over
+            if previous is not None and 'checks' in previous:
+                date_range = previous['date_range']
+                date_check = previous['checks']['date_continuity']
+                type_check = previous['checks']['data_types']
+            else:
+                # Sorted dates, shared by the date range and the continuity check
+                days = self._sorted_days(df)
+                if days.size == 0:
+                    raise ValueError("No valid dates")
+                first_day, last_day = np.datetime_as_string(days[[0, -1]])
+                date_range = f"{first_day} to {last_day}"
+                date_check = self._check_date_continuity(df, days)
+                type_check = self._check_data_types(df)
+            
             report = {
                 'dataset_name': name,
                 'total_records': len(df),
-                'date_range': f"{df['date'].min():%Y-%m-%d} to {df['date'].max():%Y-%m-%d}",
+                'date_range': date_range,
                 'checks': {},
                 'statistics': {},
                 'anomalies': {},
                 'validation_status': 'PASSED'
             }
             
+            # Reductions of each value column and the temperature stress
+            # flags, shared by the checks below
+            summaries = self._summarize_columns(df)
+            stress = self._stress_flags(df)
+            
             # Basic Data Quality Checks
-            missing_check = self._check_missing_values(df)
-            date_check = self._check_date_continuity(df)
-            range_check = self._check_value_ranges(df)
-            type_check = self._check_data_types(df)
+            if missing_check is None:
+                missing_check = self._check_missing_values(df)
+            range_check = self._check_value_ranges(df, summaries)
             
             report['checks'] = {
                 'missing_values': missing_check,
@@ -90,10 +178,10 @@ class DataValidator:
             }
             
             # Statistical Analysis
-            report['statistics'] = self._calculate_statistics(df)
+            report['statistics'] = self._calculate_statistics(df, summaries, stress)
             
             # Anomaly Detection
-            report['anomalies'] = self._detect_anomalies(df)
+            report['anomalies'] = self._detect_anomalies(df, summaries, stress)
             
             # Overall Status
             failed_checks = []
@@ -113,63 +201,99 @@ class DataValidator:
             return report
             
         except Exception as e:
-            print(f"Error validating {name}: {str(e)}")
+            # Collected with the dataset's other lines when validating concurrently
+            message = f"Error validating {name}: {str(e)}"
+            if log is None:
+                print(message)
+            else:
+                log.append(message)
             return {
                 'dataset_name': name,
                 'validation_status': 'ERROR',
                 'error_message': str(e)
             }
     
+    def _summarize_columns(self, df: pd.DataFrame) -> dict:
+        """Summary statistics of each value column present in the dataframe"""
+        return {col: _summarize(df[col].to_numpy()) for col in VALUE_COLUMNS if col in df.columns}
+    
+    def _stress_flags(self, df: pd.DataFrame) -> dict:
+        """Heat (above 35°C) and cold (below 15°C) stress flags of each day"""
+        if 'mean' not in df.columns:
+            return {}
+        temperature = df['mean'].to_numpy()
+        return {'heat': temperature > 35, 'cold': temperature < 15}
+    
     def _check_missing_values(self, df: pd.DataFrame) -> dict:
         """Check for missing values"""
-        missing = df.isnull().sum().to_dict()
+        # Per-column scans of the underlying arrays; no boolean frame
+        missing = {col: int(np.count_nonzero(pd.isna(df[col].to_numpy()))) for col in df.columns}
         return {
             'status': not any(missing.values()),
             'details': missing
         }
     
-    def _check_date_continuity(self, df: pd.DataFrame) -> dict:
+    def _sorted_days(self, df: pd.DataFrame) -> np.ndarray:
+        """Day-resolution dates of the dataframe in order, missing dates dropped"""
+        dates = df['date']
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            # Days of the local wall time rather than of UTC
+            dates = dates.dt.tz_localize(None)
+        days = dates.to_numpy().astype('datetime64[D]')
+        days = days[~np.isnat(days)]
+        # Daily series usually arrive in order; only sort when they do not
+        if not np.all(days[1:] >= days[:-1]):
+            days = np.sort(days)
+        return days
+    
+    def _check_date_continuity(self, df: pd.DataFrame, days: np.ndarray = None) -> dict:
         """Check for date continuity"""
-        date_range = df['date'].max() - df['date'].min()
-        expected_days = date_range.days + 1
+        # The sorted day-resolution dates yield the range and the number of
+        # distinct days, so duplicated days cannot hide gaps
+        dates = self._sorted_days(df) if days is None else days
+        expected_days = int((dates[-1] - dates[0]).astype(np.int64)) + 1
+        unique_days = 1 + int(np.count_nonzero(dates[1:] != dates[:-1]))
         actual_days = len(df)
         
         return {
-            'status': expected_days == actual_days,
+            'status': expected_days == unique_days == actual_days,
             'details': {
                 'expected_days': expected_days,
                 'actual_days': actual_days,
-                'missing_days': expected_days - actual_days
+                'missing_days': expected_days - unique_days,
+                'duplicate_days': int(dates.size) - unique_days
             }
         }
     
-    def _check_value_ranges(self, df: pd.DataFrame) -> dict:
+    def _check_value_ranges(self, df: pd.DataFrame, summaries: dict = None) -> dict:
         """Check value ranges"""
         checks = {}
+        if summaries is None:
+            summaries = self._summarize_columns(df)
         
-        if 'rainfall_mm' in df.columns:
-            rainfall_valid = ((df['rainfall_mm'] >= 0) & 
-                            (df['rainfall_mm'] <= self.thresholds['rainfall_max'])).all()
-            checks['rainfall'] = {
-                'status': rainfall_valid,
-                'details': {
-                    'min': df['rainfall_mm'].min(),
-                    'max': df['rainfall_mm'].max(),
-                    'invalid_count': (~((df['rainfall_mm'] >= 0) & 
-                                     (df['rainfall_mm'] <= self.thresholds['rainfall_max']))).sum()
-                }
-            }
-        
-        if 'mean' in df.columns:
-            temp_valid = ((df['mean'] >= self.thresholds['temp_min']) & 
-                         (df['mean'] <= self.thresholds['temp_max'])).all()
-            checks['temperature'] = {
-                'status': temp_valid,
+        bounds = {
+            'rainfall': ('rainfall_mm', 0, self.thresholds['rainfall_max']),
+            'temperature': ('mean', self.thresholds['temp_min'], self.thresholds['temp_max'])
+        }
+        for check, (col, low, high) in bounds.items():
+            if col not in df.columns:
+                continue
+            # Missing values are out of range. When the column's extremes are
+            # within bounds they are the only invalid values, and no mask is
+            # needed; otherwise one in-range mask gives the count
+            values = df[col].to_numpy()
+            summary = summaries[col]
+            if low <= summary['min'] and summary['max'] <= high:
+                invalid_count = values.size - summary['count']
+            else:
+                in_range = (values >= low) & (values <= high)
+                invalid_count = values.size - np.count_nonzero(in_range)
+            checks[check] = {
+                'status': invalid_count == 0,
                 'details': {
-                    'min': df['mean'].min(),
-                    'max': df['mean'].max(),
-                    'invalid_count': (~((df['mean'] >= self.thresholds['temp_min']) & 
-                                     (df['mean'] <= self.thresholds['temp_max']))).sum()
+                    'min': summary['min'],
+                    'max': summary['max'],
+                    'invalid_count': invalid_count
                 }
             }
         
@@ -177,50 +301,70 @@ class DataValidator:
     
     def _check_data_types(self, df: pd.DataFrame) -> dict:
         """Check data types"""
+        # Dtype kind and name are plain attributes (datetime64 with or
+        # without a timezone is kind 'M'); no type dispatch or repr
+        dtypes = df.dtypes
         return {
-            'status': pd.api.types.is_datetime64_any_dtype(df['date']),
-            'details': {col: str(dtype) for col, dtype in df.dtypes.items()}
+            'status': dtypes['date'].kind == 'M',
+            'details': {col: dtype.name for col, dtype in dtypes.items()}
         }
     
-    def _calculate_statistics(self, df: pd.DataFrame) -> dict:
+    def _calculate_statistics(self, df: pd.DataFrame, summaries: dict = None, stress: dict = None) -> dict:
         """Calculate basic statistics"""
         stats = {}
+        if summaries is None:
+            summaries = self._summarize_columns(df)
+        if stress is None:
+            stress = self._stress_flags(df)
         
-        if 'rainfall_mm' in df.columns:
+        if 'rainfall_mm' in summaries:
+            rain = summaries['rainfall_mm']
             stats['rainfall'] = {
-                'mean': df['rainfall_mm'].mean(),
-                'std': df['rainfall_mm'].std(),
-                'median': df['rainfall_mm'].median(),
-                'q95': df['rainfall_mm'].quantile(0.95)
+                'mean': rain['mean'],
+                'std': rain['std'],
+                'median': rain['median'],
+                'q95': rain['q95']
             }
         
-        if 'mean' in df.columns:
+        if 'mean' in summaries:
+            temp = summaries['mean']
             stats['temperature'] = {
-                'mean': df['mean'].mean(),
-                'std': df['mean'].std(),
-                'median': df['mean'].median(),
-                'extreme_days': (df['mean'] > 35).sum()
+                'mean': temp['mean'],
+                'std': temp['std'],
+                'median': temp['median'],
+                'extreme_days': np.count_nonzero(stress['heat'])
             }
             
         return stats
     
-    def _detect_anomalies(self, df: pd.DataFrame) -> dict:
+    def _detect_anomalies(self, df: pd.DataFrame, summaries: dict = None, stress: dict = None) -> dict:
         """Detect anomalies in the data"""
         anomalies = {}
+        if summaries is None:
+            summaries = self._summarize_columns(df)
+        if stress is None:
+            stress = self._stress_flags(df)
+        
+        # Flag arrays come straight from the value columns, and only the
+        # date column is indexed with them (not the whole frame). Dates are
+        # reported as datetime64 arrays rather than lists of Timestamps
+        dates = df['date'].to_numpy()
         
         if 'rainfall_mm' in df.columns:
+            rainfall = df['rainfall_mm'].to_numpy()
+            
             # Extreme rainfall events
-            threshold = df['rainfall_mm'].quantile(0.95)
-            extreme_events = df[df['rainfall_mm'] > threshold]
+            threshold = summaries['rainfall_mm']['q95']
+            extreme = rainfall > threshold
             
             # Dry spells
-            dry_spells = self._find_dry_spells(df)
+            dry_spells = self._dry_spell_lengths(rainfall < 1)
             
             anomalies['rainfall'] = {
                 'extreme_events': {
-                    'count': len(extreme_events),
+                    'count': int(np.count_nonzero(extreme)),
                     'threshold': threshold,
-                    'dates': extreme_events['date'].tolist()
+                    'dates': dates[extreme]
                 },
                 'dry_spells': {
                     'count': len(dry_spells),
@@ -230,18 +374,18 @@ class DataValidator:
             }
         
         if 'mean' in df.columns:
-            # Heat stress days
-            heat_stress = df[df['mean'] > 35]
-            cold_stress = df[df['mean'] < 15]
+            # Heat and cold stress days
+            heat_stress = stress['heat']
+            cold_stress = stress['cold']
             
             anomalies['temperature'] = {
                 'heat_stress_days': {
-                    'count': len(heat_stress),
-                    'dates': heat_stress['date'].tolist()
+                    'count': int(np.count_nonzero(heat_stress)),
+                    'dates': dates[heat_stress]
                 },
                 'cold_stress_days': {
-                    'count': len(cold_stress),
-                    'dates': cold_stress['date'].tolist()
+                    'count': int(np.count_nonzero(cold_stress)),
+                    'dates': dates[cold_stress]
                 }
             }
             
@@ -249,100 +393,101 @@ class DataValidator:
     
     def _find_dry_spells(self, df: pd.DataFrame) -> list:
         """Find dry spells (consecutive days with no/minimal rainfall)"""
-        dry_days = df['rainfall_mm'] < 1
-        spell_lengths = []
-        current_spell = 0
+        return self._dry_spell_lengths(df['rainfall_mm'].to_numpy() < 1)
+    
+    def _dry_spell_lengths(self, dry_days: np.ndarray) -> list:
+        """Lengths of the runs of dry days that reach the dry spell threshold"""
+        if dry_days.size == 0:
+            return []
         
-        for is_dry in dry_days:
-            if is_dry:
-                current_spell += 1
-            elif current_spell >= self.thresholds['dry_spell']:
-                spell_lengths.append(current_spell)
-                current_spell = 0
-            else:
-                current_spell = 0
-                
-        if current_spell >= self.thresholds['dry_spell']:
-            spell_lengths.append(current_spell)
-            
-        return spell_lengths
+        # Run-length encode the dry days: runs start where the value changes,
+        # and only the run boundaries (not the padded series) are allocated
+        starts = np.flatnonzero(dry_days[1:] != dry_days[:-1]) + 1
+        bounds = np.concatenate(([0], starts, [dry_days.size]))
+        run_lengths = np.diff(bounds)
+        spell_lengths = run_lengths[dry_days[bounds[:-1]]]
+        
+        return spell_lengths[spell_lengths >= self.thresholds['dry_spell']].tolist()
         
     def export_to_excel(self, output_path: str = "climate_analysis_results.xlsx"):
         """Export validation and analysis results to Excel file with multiple sheets"""
         try:
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                # Summary sheet
-                summary_data = []
-                for key, report in self.quality_reports.items():
-                    summary_data.append({
+            # Rows are streamed into a write-only workbook as they are built
+            workbook = Workbook(write_only=True)
+            reports = self.quality_reports.items()
+            
+            # Summary sheet
+            _append_records(workbook, 'Summary', [
+                {
+                    'Dataset': key,
+                    'Status': report['validation_status'],
+                    'Total Records': report['total_records'],
+                    'Date Range': report['date_range'],
+                    'Failed Checks': ', '.join(report.get('failed_checks', []))
+                }
+                for key, report in reports
+            ])
+            
+            # Statistics sheet
+            stats_data = []
+            for key, report in reports:
+                stats = report['statistics']
+                if 'rainfall' in stats:
+                    stats_data.append({
                         'Dataset': key,
-                        'Status': report['validation_status'],
-                        'Total Records': report['total_records'],
-                        'Date Range': report['date_range'],
-                        'Failed Checks': ', '.join(report.get('failed_checks', []))
+                        'Type': 'Rainfall',
+                        'Mean': stats['rainfall']['mean'],
+                        'Std Dev': stats['rainfall']['std'],
+                        'Median': stats['rainfall']['median'],
+                        '95th Percentile': stats['rainfall']['q95']
                     })
-                pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Statistics sheet
-                stats_data = []
-                for key, report in self.quality_reports.items():
-                    stats = report['statistics']
-                    if 'rainfall' in stats:
-                        stats_data.append({
-                            'Dataset': key,
-                            'Type': 'Rainfall',
-                            'Mean': stats['rainfall']['mean'],
-                            'Std Dev': stats['rainfall']['std'],
-                            'Median': stats['rainfall']['median'],
-                            '95th Percentile': stats['rainfall']['q95']
-                        })
-                    if 'temperature' in stats:
-                        stats_data.append({
-                            'Dataset': key,
-                            'Type': 'Temperature',
-                            'Mean': stats['temperature']['mean'],
-                            'Std Dev': stats['temperature']['std'],
-                            'Median': stats['temperature']['median'],
-                            'Extreme Days': stats['temperature']['extreme_days']
-                        })
-                pd.DataFrame(stats_data).to_excel(writer, sheet_name='Statistics', index=False)
-                
-                # Anomalies sheet
-                anomalies_data = []
-                for key, report in self.quality_reports.items():
-                    anomalies = report['anomalies']
-                    if 'rainfall' in anomalies:
-                        anomalies_data.append({
-                            'Dataset': key,
-                            'Type': 'Rainfall',
-                            'Extreme Events Count': anomalies['rainfall']['extreme_events']['count'],
-                            'Extreme Events Threshold': anomalies['rainfall']['extreme_events']['threshold'],
-                            'Dry Spells Count': anomalies['rainfall']['dry_spells']['count'],
-                            'Max Dry Spell Duration': anomalies['rainfall']['dry_spells']['max_duration']
-                        })
-                    if 'temperature' in anomalies:
-                        anomalies_data.append({
-                            'Dataset': key,
-                            'Type': 'Temperature',
-                            'Heat Stress Days': anomalies['temperature']['heat_stress_days']['count'],
-                            'Cold Stress Days': anomalies['temperature']['cold_stress_days']['count']
-                        })
-                pd.DataFrame(anomalies_data).to_excel(writer, sheet_name='Anomalies', index=False)
-                
-                # Data Quality Checks sheet
-                checks_data = []
-                for key, report in self.quality_reports.items():
-                    checks = report['checks']
-                    checks_data.append({
+                if 'temperature' in stats:
+                    stats_data.append({
                         'Dataset': key,
-                        'Missing Values Status': checks['missing_values']['status'],
-                        'Date Continuity Status': checks['date_continuity']['status'],
-                        'Data Types Status': checks['data_types']['status'],
-                        'Expected Days': checks['date_continuity']['details']['expected_days'],
-                        'Actual Days': checks['date_continuity']['details']['actual_days']
+                        'Type': 'Temperature',
+                        'Mean': stats['temperature']['mean'],
+                        'Std Dev': stats['temperature']['std'],
+                        'Median': stats['temperature']['median'],
+                        'Extreme Days': stats['temperature']['extreme_days']
                     })
-                pd.DataFrame(checks_data).to_excel(writer, sheet_name='Data Quality', index=False)
-                
+            _append_records(workbook, 'Statistics', stats_data)
+            
+            # Anomalies sheet
+            anomalies_data = []
+            for key, report in reports:
+                anomalies = report['anomalies']
+                if 'rainfall' in anomalies:
+                    anomalies_data.append({
+                        'Dataset': key,
+                        'Type': 'Rainfall',
+                        'Extreme Events Count': anomalies['rainfall']['extreme_events']['count'],
+                        'Extreme Events Threshold': anomalies['rainfall']['extreme_events']['threshold'],
+                        'Dry Spells Count': anomalies['rainfall']['dry_spells']['count'],
+                        'Max Dry Spell Duration': anomalies['rainfall']['dry_spells']['max_duration']
+                    })
+                if 'temperature' in anomalies:
+                    anomalies_data.append({
+                        'Dataset': key,
+                        'Type': 'Temperature',
+                        'Heat Stress Days': anomalies['temperature']['heat_stress_days']['count'],
+                        'Cold Stress Days': anomalies['temperature']['cold_stress_days']['count']
+                    })
+            _append_records(workbook, 'Anomalies', anomalies_data)
+            
+            # Data Quality Checks sheet
+            _append_records(workbook, 'Data Quality', [
+                {
+                    'Dataset': key,
+                    'Missing Values Status': report['checks']['missing_values']['status'],
+                    'Date Continuity Status': report['checks']['date_continuity']['status'],
+                    'Data Types Status': report['checks']['data_types']['status'],
+                    'Expected Days': report['checks']['date_continuity']['details']['expected_days'],
+                    'Actual Days': report['checks']['date_continuity']['details']['actual_days']
+                }
+                for key, report in reports
+            ])
+            
+            workbook.save(output_path)
             print(f"\nResults exported successfully to {output_path}")
             return True
             
@@ -0,0 +1,144 @@
+"""
+Tests for climate analysis functionality.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from src.analyzer import ClimateAnalyzer, _exceedance_frequency, _exceedance_frequencies
+
+@pytest.fixture
+def monthly_data():
+    """Create sample monthly aggregates"""
+    rng = np.random.default_rng(42)
+    dates = pd.date_range(start='2015-01-31', periods=120, freq='ME')
+    monthly = {}
+    for region in ['maharashtra', 'madhya_pradesh']:
+        monthly[f'{region}_precipitation_monthly'] = pd.DataFrame({
+            'date': dates,
+            'rainfall_mm': rng.gamma(2.0, 2.0, size=120)
+        })
+        monthly[f'{region}_temperature_monthly'] = pd.DataFrame({
+            'date': dates,
+            'mean': rng.normal(26.0, 4.0, size=120)
+        })
+    return {'monthly': monthly}
+
+@pytest.fixture
+def crop_data():
+    """Create sample seasonal crop data"""
+    rng = np.random.default_rng(7)
+    crop = {}
+    for key in ['maharashtra_kharif', 'madhya_pradesh_rabi']:
+        crop[key] = pd.DataFrame({
+            'rainfall_mm': rng.gamma(1.5, 4.0, size=1500),
+            'mean': rng.normal(25.0, 5.0, size=1500)
+        })
+    return crop
+
+def test_assess_infrastructure_matches_pandas(monthly_data):
+    """Test infrastructure risk against a pandas quantile reference"""
+    analyzer = ClimateAnalyzer()
+    result = analyzer._assess_infrastructure(monthly_data)
+    
+    for region_short, region_full in [('mh', 'maharashtra'), ('mp', 'madhya_pradesh')]:
+        rain = monthly_data['monthly'][f'{region_full}_precipitation_monthly']['rainfall_mm']
+        temp = monthly_data['monthly'][f'{region_full}_temperature_monthly']['mean']
+        rain_freq = (rain > rain.quantile(0.95)).mean()
+        temp_freq = (temp > temp.quantile(0.95)).mean()
+        expected = min(100, (rain_freq * 50 + temp_freq * 50) * 100)
+        
+        assert result[f'{region_short}_infrastructure_risk'] == pytest.approx(expected, rel=1e-4)
+
+def test_analyze_crops_matches_pandas(crop_data):
+    """Test crop stress against a pandas mask reference"""
+    analyzer = ClimateAnalyzer()
+    result = analyzer._analyze_crops(crop_data)
+    
+    for key, df in crop_data.items():
+        optimal = (df['mean'] >= 20) & (df['mean'] <= 30) & (df['rainfall_mm'] >= 5)
+        expected = (~optimal).mean() * 100
+        
+        assert result[f'{key}_stress'] == pytest.approx(expected, rel=1e-4)
+
+def test_classify_seasons():
+    """Test drought and excess rain thresholds around the seasonal mean"""
+    analyzer = ClimateAnalyzer()
+    years = pd.Index(range(2015, 2025), name='year')
+    seasonal = {'mh_kharif': pd.Series(np.linspace(2.0, 8.0, 10), index=years)}
+    
+    result = analyzer._classify_seasons(seasonal)['mh_kharif']
+    assert result.index.equals(years)
+    assert list(result.iloc[[0, 4, -1]]) == ['Drought', 'Normal', 'Excess Rain']
+
+def test_economic_impact_rows():
+    """Test one row per region, season, year and crop with the right losses"""
+    analyzer = ClimateAnalyzer()
+    years = pd.Index([2020, 2021], name='year')
+    classification = {
+        'mh_kharif': pd.Series(['Drought', 'Normal'], index=years),
+        'mp_rabi': pd.Series(['Excess Rain', 'Drought'], index=years)
+    }
+    result = analyzer._calculate_economic_impact(classification)
+    
+    n_crops = len(ClimateAnalyzer.crop_info)
+    assert len(result) == 4 * n_crops
+    assert list(result.columns) == ['Region', 'Year', 'Season', 'Crop', 'Status',
+                                    'Base_Yield(qtl)', 'Base_Revenue(INR)',
+                                    'Estimated_Loss(INR)']
+    
+    row = result.iloc[2 * n_crops + 1]  # mp_rabi, 2020, second crop
+    crop = ClimateAnalyzer.crop_info[row['Crop']]
+    assert (row['Region'], row['Year'], row['Season'], row['Status']) == \
+        ('Madhya Pradesh', 2020, 'Rabi', 'Excess Rain')
+    assert row['Estimated_Loss(INR)'] == pytest.approx(
+        -0.10 * crop['area'] * crop['yield'] * crop['price'])
+
+def test_analyze_crops_counts_missing_as_stress():
+    """Test that days with missing temperature or rainfall count as stress days"""
+    analyzer = ClimateAnalyzer()
+    crop = {'maharashtra_kharif': pd.DataFrame({
+        'mean': [25.0, 25.0, np.nan, 18.0],
+        'rainfall_mm': [10.0, np.nan, 10.0, 10.0]
+    })}
+    result = analyzer._analyze_crops(crop)
+    
+    assert result['maharashtra_kharif_stress'] == pytest.approx(75.0)
+
+def test_climate_indicator_trend_matches_polyfit():
+    """Test that the closed-form trend matches a degree-1 least-squares fit"""
+    analyzer = ClimateAnalyzer()
+    rng = np.random.default_rng(3)
+    series = pd.Series(rng.normal(50.0, 20.0, size=120) + 0.3 * np.arange(120))
+    result = analyzer._calculate_climate_indicators({'rain': series, 'single': series[:1]})
+    
+    assert result['rain_trend'] == pytest.approx(
+        np.polyfit(np.arange(len(series)), series.values, 1)[0], rel=1e-12)
+    assert np.isnan(result['single_trend'])
+
+def test_stacked_exceedance_matches_per_column():
+    """Test that the stacked exceedance pass matches one column at a time"""
+    rng = np.random.default_rng(11)
+    equal = [rng.normal(0.0, 1.0, size=120).astype(np.float32) for _ in range(4)]
+    ragged = equal[:2] + [equal[2][:100]]
+    gappy = [c.copy() for c in equal]
+    gappy[1][5] = np.nan
+    
+    for columns in (equal, ragged, gappy):
+        expected = [_exceedance_frequency(c, 0.95) for c in columns]
+        np.testing.assert_array_equal(_exceedance_frequencies(columns, 0.95), expected)
+
+def test_analyze_resilience_scores():
+    """Test resilience scoring and the up-front indicator check"""
+    analyzer = ClimateAnalyzer()
+    indicators = {
+        'mh_precip_variability': 0.2, 'mh_precip_drought_frequency': 0.1, 'mh_temp_anomaly': 1.0,
+        'mp_precip_variability': 1.5, 'mp_precip_drought_frequency': 0.5, 'mp_temp_anomaly': 2.0,
+    }
+    result = analyzer._analyze_resilience(indicators)
+    
+    assert result['mh_resilience_score'] == pytest.approx(100 - 10 - 10 - 10)
+    assert result['mp_resilience_score'] == 0.0  # clipped
+    
+    del indicators['mp_temp_anomaly']
+    with pytest.raises(KeyError, match='mp_temp_anomaly'):
+        analyzer._analyze_resilience(indicators)
@@ -1,14 +1,15 @@
 """
 Tests for data loading functionality.
 """
+import os
+import time
 import pytest
-from pathlib import Path
 import pandas as pd
-from src.data_loader import DataLoader
+from src.data_loader import DATA_FILES, DataLoader
 
 @pytest.fixture
-def test_data_path():
-    return Path("tests/test_data")
+def test_data_path(tmp_path):
+    return tmp_path / "test_data"
 
 @pytest.fixture
 def sample_data(test_data_path):
@@ -31,3 +32,51 @@ def test_load_csv(test_data_path, sample_data):
     assert 'rainfall_mm' in df.columns
     assert pd.api.types.is_datetime64_any_dtype(df['date'])
     assert len(df) == len(sample_data)
+    
+    # Without a cache directory nothing is written next to the data
+    assert not list(test_data_path.glob("*.pkl"))
+
+def test_load_csv_coerces_non_numeric(tmp_path):
+    """Non-numeric readings become NaN instead of failing the load"""
+    (tmp_path / "MH_precipitation.csv").write_text(
+        "date,rainfall_mm\n2020-01-01,1.5\n2020-01-02,n/a\n2020-01-03,\n"
+    )
+    df = DataLoader(tmp_path)._load_csv("MH_precipitation.csv")
+    
+    assert pd.api.types.is_datetime64_any_dtype(df['date'])
+    assert df['rainfall_mm'].dtype == 'float32'
+    assert df['rainfall_mm'].isna().sum() == 2
+
+def test_load_all_warnings_in_file_order(tmp_path, capsys):
+    """Missing-value warnings are printed in DATA_FILES order, before the summary"""
+    for n_missing, filename in enumerate(DATA_FILES.values(), start=1):
+        value_col = 'rainfall_mm' if 'precipitation' in filename else 'mean'
+        rows = ''.join(f"2020-01-{day:02d},{'' if day <= n_missing else 1.0}\n" for day in range(1, 11))
+        (tmp_path / filename).write_text(f"date,{value_col}\n{rows}")
+    DataLoader(tmp_path).load_all()
+    
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:len(DATA_FILES) + 1] == [
+        f"Warning: Found {n_missing} missing values in {filename}"
+        for n_missing, filename in enumerate(DATA_FILES.values(), start=1)
+    ] + ["Data loaded successfully:"]
+
+def test_load_csv_reuses_parsed_cache(tmp_path):
+    """The pickled frame is reused until the CSV changes"""
+    csv_path = tmp_path / "MH_temperature.csv"
+    csv_path.write_text("date,mean\n2020-01-01,25.0\n2020-01-02,26.0\n")
+    cache_dir = tmp_path / "cache"
+    # A pickle left by an older cache version is replaced
+    cache_dir.mkdir()
+    (cache_dir / "MH_temperature.v1.pkl").write_bytes(b"stale")
+    loader = DataLoader(tmp_path, cache_dir)
+    first = loader._load_csv("MH_temperature.csv")
+    
+    assert [f.name for f in cache_dir.glob("MH_temperature*.pkl")] == [loader._cache_path(csv_path).name]
+    assert not list(tmp_path.glob("*.pkl"))
+    pd.testing.assert_frame_equal(loader._load_csv("MH_temperature.csv"), first)
+    
+    # A newer CSV invalidates the cache
+    csv_path.write_text("date,mean\n2020-01-01,30.0\n")
+    os.utime(csv_path, (time.time() + 5, time.time() + 5))
+    assert loader._load_csv("MH_temperature.csv")['mean'].tolist() == [30.0]
@@ -0,0 +1,21 @@
+"""
+Tests for the export helpers.
+"""
+import numpy as np
+import pandas as pd
+from src.export import widen_float32
+
+def test_widen_float32():
+    """float32 readings widen to their shortest decimal form"""
+    frame = pd.DataFrame({'rainfall_mm': np.array([23.7, np.nan], dtype=np.float32), 'day': [1, 2]})
+    widened = widen_float32(frame)
+    
+    assert widened['rainfall_mm'].dtype == np.float64
+    assert widened['rainfall_mm'].iloc[0] == 23.7
+    assert widened['rainfall_mm'].isna().iloc[1]
+    assert frame['rainfall_mm'].dtype == np.float32
+    assert widen_float32(np.float32(23.7)) == 23.7
+    assert widen_float32(frame['day']) is frame['day']
+    
+    grid = np.array([[0.1, np.nan], [23.7, 0.1]], dtype=np.float32)
+    np.testing.assert_array_equal(widen_float32(grid), [[0.1, np.nan], [23.7, 0.1]])
@@ -0,0 +1,51 @@
+"""
+Tests for the pipeline helpers.
+"""
+import json
+import numpy as np
+import pandas as pd
+from src.pipeline import _aggregate, _cache_file, _json_default, _read_cache, _write_cache
+
+def test_cache_is_version_stamped(tmp_path):
+    """Test that caches from other versions are neither read nor kept"""
+    data_path = tmp_path / "raw"
+    data_path.mkdir()
+    (data_path / "MH_precipitation.csv").write_text("date,rainfall_mm\n2020-01-01,1.0\n")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+
+    # A pickle written by an older version under the unstamped name
+    pd.to_pickle({'stale': True}, cache_dir / "raw.pkl")
+    cache_file = _cache_file(cache_dir, "raw")
+    assert cache_file.name != "raw.pkl"
+    assert _read_cache(cache_file, data_path) is None
+
+    _write_cache(cache_file, {'fresh': True})
+    assert _read_cache(cache_file, data_path) == {'fresh': True}
+    assert [f.name for f in cache_dir.iterdir()] == [cache_file.name]
+
+def test_aggregate_coerces_dates_first():
+    """Test that string dates are converted before the aggregations run"""
+    dates = pd.date_range('2020-01-01', periods=365)
+    data = {}
+    for region in ('maharashtra', 'madhya_pradesh'):
+        data[f'{region}_precipitation'] = pd.DataFrame({'date': dates.strftime('%Y-%m-%d'), 'rainfall_mm': 1.0})
+        data[f'{region}_temperature'] = pd.DataFrame({'date': dates.strftime('%Y-%m-%d'), 'mean': 25.0})
+    
+    aggregates = _aggregate(data)
+    
+    assert all(pd.api.types.is_datetime64_any_dtype(df['date']) for df in data.values())
+    assert len(aggregates['monthly']['maharashtra_precipitation_monthly']) == 12
+    assert len(aggregates['crop']['madhya_pradesh_kharif']) == 153
+
+def test_json_default_widens_float32():
+    """Test that float32 values are written by their shortest decimal form"""
+    value = np.float32(23.7)
+    payload = json.loads(json.dumps({
+        'scalar': value,
+        'array': np.array([value]),
+        'series': pd.Series([value], index=[2020]),
+        'frame': pd.DataFrame({'mean': [value]})
+    }, default=_json_default))
+    
+    assert payload == {'scalar': 23.7, 'array': [23.7], 'series': {'2020': 23.7}, 'frame': [{'mean': 23.7}]}
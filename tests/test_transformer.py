@@ -2,6 +2,7 @@
 Tests for data transformation functionality.
 """
 import pytest
+import numpy as np
 import pandas as pd
 from src.transformer import DataTransformer
 
@@ -42,3 +43,75 @@ def test_seasonal_aggregates(sample_data):
     assert 'mh_precip_kharif' in result
     assert 'mh_precip_rabi' in result
     assert isinstance(result['mh_precip_kharif'], pd.Series)
+
+def test_monthly_aggregates_match_grouper():
+    """Test monthly means against pd.Grouper, including a month without data"""
+    dates = pd.date_range(start='2020-01-01', periods=365)
+    df = pd.DataFrame({'date': dates, 'rainfall_mm': np.arange(365, dtype=np.float32)})
+    df = df[dates.month != 4]  # April missing
+    transformer = DataTransformer()
+    result = transformer._calculate_monthly_aggregates({'maharashtra_precipitation': df})
+    
+    expected = df.groupby(pd.Grouper(key='date', freq='ME'))['rainfall_mm'].mean().reset_index()
+    pd.testing.assert_frame_equal(result['maharashtra_precipitation_monthly'], expected)
+    assert len(expected) == 12 and expected['rainfall_mm'].isna().sum() == 1
+
+def test_resilience_indicators_reuse_seasonal():
+    """Test that precomputed seasonal aggregates give the same indicators"""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range(start='2015-01-01', periods=3 * 365)
+    data = {
+        'maharashtra_precipitation': pd.DataFrame({'date': dates, 'rainfall_mm': rng.gamma(2.0, 2.0, len(dates))}),
+        'madhya_pradesh_precipitation': pd.DataFrame({'date': dates, 'rainfall_mm': rng.gamma(2.0, 2.0, len(dates))}),
+    }
+    transformer = DataTransformer()
+    seasonal = transformer._calculate_seasonal_aggregates(data)
+    
+    assert transformer._calculate_resilience_indicators(data, seasonal=seasonal) == \
+        transformer._calculate_resilience_indicators(data)
+
+def test_crop_data_aligned_and_merged():
+    """Test that aligned dates give the same crop data as the inner merge"""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range(start='2020-01-01', periods=365)
+    data = {}
+    for region in ('maharashtra', 'madhya_pradesh'):
+        data[f'{region}_precipitation'] = pd.DataFrame({'date': dates, 'rainfall_mm': rng.gamma(2.0, 2.0, 365)})
+        data[f'{region}_temperature'] = pd.DataFrame({'date': dates, 'mean': rng.normal(25, 5, 365)})
+    transformer = DataTransformer()
+    aligned = transformer._transform_crop_data(data)
+    
+    # Dropping a temperature day forces the merge, which leaves that day out
+    data['maharashtra_temperature'] = data['maharashtra_temperature'].drop(index=200)
+    merged = transformer._transform_crop_data(data)
+    
+    kharif = aligned['maharashtra_kharif']
+    pd.testing.assert_frame_equal(merged['maharashtra_kharif'].reset_index(drop=True),
+                                  kharif[kharif['date'] != dates[200]].reset_index(drop=True))
+    pd.testing.assert_frame_equal(merged['madhya_pradesh_rabi'], aligned['madhya_pradesh_rabi'])
+
+def test_tz_aware_dates_use_local_months():
+    """Test that tz-aware dates are binned by local month, as for naive dates"""
+    rng = np.random.default_rng(0)
+    naive = pd.date_range(start='2020-01-01', periods=365)
+    local = naive.tz_localize('Asia/Kolkata')
+    data = {}
+    for region in ('maharashtra', 'madhya_pradesh'):
+        data[f'{region}_precipitation'] = pd.DataFrame({'date': local, 'rainfall_mm': rng.gamma(2.0, 2.0, 365)})
+        data[f'{region}_temperature'] = pd.DataFrame({'date': local, 'mean': rng.normal(25, 5, 365)})
+    naive_data = {key: df.assign(date=naive) for key, df in data.items()}
+    transformer = DataTransformer()
+    
+    monthly = transformer._calculate_monthly_aggregates(data)['maharashtra_precipitation_monthly']
+    expected = data['maharashtra_precipitation'].groupby(
+        pd.Grouper(key='date', freq='ME'))['rainfall_mm'].mean().reset_index()
+    pd.testing.assert_frame_equal(monthly, expected)
+    
+    seasonal = transformer._calculate_seasonal_aggregates(data)
+    for key, series in transformer._calculate_seasonal_aggregates(naive_data).items():
+        pd.testing.assert_series_equal(seasonal[key], series)
+    assert transformer._calculate_resilience_indicators(data) == \
+        transformer._calculate_resilience_indicators(naive_data)
+    
+    kharif = transformer._transform_crop_data(data)['maharashtra_kharif']
+    assert kharif['date'].iloc[0] == pd.Timestamp('2020-06-01', tz='Asia/Kolkata')
@@ -0,0 +1,193 @@
+"""
+Tests for data validation functionality.
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from src.validator import DataValidator
+
+def test_find_dry_spells():
+    """Test dry spell detection, including spells at both ends of the series"""
+    validator = DataValidator()
+    rainfall = [0.0] * 20 + [5.0] + [0.5] * 14 + [np.nan] + [0.0] * 15 + [2.0] * 3 + [0.0] * 16
+    df = pd.DataFrame({'rainfall_mm': rainfall})
+    
+    # The 14-day spell is too short and a missing day is not dry
+    assert validator._find_dry_spells(df) == [20, 15, 16]
+    assert validator._find_dry_spells(df.iloc[:0]) == []
+
+def test_check_value_ranges():
+    """Test range checks, counting missing values as invalid"""
+    validator = DataValidator()
+    df = pd.DataFrame({
+        'rainfall_mm': [0.0, 10.0, 600.0, np.nan, -1.0],
+        'mean': [25.0, 30.0, 20.0, 15.0, 10.0]
+    })
+    checks = validator._check_value_ranges(df)
+    
+    assert not checks['rainfall']['status']
+    assert checks['rainfall']['details']['invalid_count'] == 3
+    assert checks['rainfall']['details']['min'] == -1.0
+    assert checks['rainfall']['details']['max'] == 600.0
+    assert checks['temperature']['status']
+    assert checks['temperature']['details']['invalid_count'] == 0
+    
+    # Within bounds, a missing value is still invalid
+    checks = validator._check_value_ranges(df.assign(rainfall_mm=[0.0, 10.0, 20.0, np.nan, 1.0]))
+    assert not checks['rainfall']['status']
+    assert checks['rainfall']['details']['invalid_count'] == 1
+
+def test_statistics_match_pandas():
+    """Test that the shared column summaries follow pandas' skipna reductions"""
+    validator = DataValidator()
+    rng = np.random.default_rng(4)
+    rainfall = rng.gamma(2.0, 3.0, size=500).astype(np.float32)
+    rainfall[[3, 250]] = np.nan
+    df = pd.DataFrame({'date': pd.date_range('2020-01-01', periods=500), 'rainfall_mm': rainfall})
+    stats = validator._calculate_statistics(df)['rainfall']
+    
+    assert stats['mean'] == pytest.approx(df['rainfall_mm'].mean(), rel=1e-6)
+    assert stats['std'] == pytest.approx(df['rainfall_mm'].std(), rel=1e-6)
+    assert stats['median'] == df['rainfall_mm'].median()
+    assert stats['q95'] == pytest.approx(df['rainfall_mm'].quantile(0.95), rel=1e-6)
+    assert validator._detect_anomalies(df)['rainfall']['extreme_events']['count'] == \
+        (df['rainfall_mm'] > df['rainfall_mm'].quantile(0.95)).sum()
+
+def test_statistics_single_integer_value():
+    """Test that a single integer reading gives a NaN standard deviation"""
+    validator = DataValidator()
+    df = pd.DataFrame({'date': pd.date_range('2020-01-01', periods=1), 'mean': [25]})
+    
+    stats = validator._calculate_statistics(df)['temperature']
+    assert stats['mean'] == 25 and stats['median'] == 25
+    assert np.isnan(stats['std'])
+    assert validator._check_value_ranges(df)['temperature']['status']
+    assert validator._validate_dataframe(df, 'single')['validation_status'] != 'ERROR'
+
+def test_detect_anomalies_dates():
+    """Test that anomaly dates are reported as datetime64 arrays"""
+    validator = DataValidator()
+    df = pd.DataFrame({
+        'date': pd.date_range('2020-01-01', periods=4),
+        'mean': [36.0, 25.0, 10.0, 40.0]
+    })
+    heat = validator._detect_anomalies(df)['temperature']['heat_stress_days']
+    
+    assert heat['count'] == 2
+    assert heat['dates'].dtype.kind == 'M'
+    assert list(heat['dates']) == list(df['date'].to_numpy()[[0, 3]])
+
+def test_check_date_continuity_duplicates():
+    """Test that a duplicated day does not mask a missing one"""
+    validator = DataValidator()
+    dates = pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-02', '2020-01-04'])
+    result = validator._check_date_continuity(pd.DataFrame({'date': dates}))
+    
+    assert not result['status']
+    assert result['details'] == {
+        'expected_days': 4,
+        'actual_days': 4,
+        'missing_days': 1,
+        'duplicate_days': 1
+    }
+    
+    complete = pd.DataFrame({'date': pd.date_range('2020-01-01', periods=10)})
+    assert validator._check_date_continuity(complete)['status']
+
+def test_validate_data_keeps_float32_values():
+    """Test that float32 value columns stay float32 through interpolation"""
+    validator = DataValidator()
+    data = {'test': pd.DataFrame({
+        'date': pd.date_range('2020-01-01', periods=5),
+        'rainfall_mm': np.array([0.0, 1.5, np.nan, 2.5, 0.5], dtype=np.float32),
+        'mean': np.array([20, 21, 22, 23, np.nan], dtype=np.float32)
+    })}
+    
+    validator.validate_data(data)
+    assert data['test']['rainfall_mm'].dtype == np.float32
+    assert data['test']['mean'].dtype == np.float32
+    assert data['test']['date'].dtype == 'datetime64[ns]'
+
+def test_validate_data_fills_edges():
+    """Test that interpolation also fills leading and trailing gaps"""
+    validator = DataValidator()
+    data = {'test': pd.DataFrame({
+        'date': pd.date_range('2020-01-01', periods=6),
+        'rainfall_mm': [np.nan, 2.0, np.nan, 4.0, 5.0, np.nan]
+    })}
+    
+    validator.validate_data(data)
+    assert data['test']['rainfall_mm'].tolist() == [2.0, 2.0, 3.0, 4.0, 5.0, 5.0]
+    assert validator.quality_reports['test']['checks']['missing_values']['status']
+
+def test_export_to_excel(tmp_path):
+    """Test the exported sheets, leaving cells a dataset lacks empty"""
+    validator = DataValidator()
+    dates = pd.date_range('2020-01-01', periods=30)
+    validator.validate_data({
+        'rain': pd.DataFrame({'date': dates, 'rainfall_mm': np.linspace(0, 40, 30, dtype=np.float32)}),
+        'temp': pd.DataFrame({'date': dates, 'mean': np.linspace(10, 40, 30, dtype=np.float32)})
+    })
+    output_path = tmp_path / 'results.xlsx'
+    assert validator.export_to_excel(output_path)
+    
+    sheets = pd.read_excel(output_path, sheet_name=None)
+    assert list(sheets) == ['Summary', 'Statistics', 'Anomalies', 'Data Quality']
+    assert sheets['Summary']['Dataset'].tolist() == ['rain', 'temp']
+    stats = sheets['Statistics'].set_index('Dataset')
+    assert stats.loc['rain', 'Median'] == 20.0
+    assert stats.loc['temp', 'Mean'] == float(str(np.linspace(10, 40, 30).astype(np.float32).mean()))
+    anomalies = sheets['Anomalies'].set_index('Dataset')
+    assert anomalies.loc['temp', 'Heat Stress Days'] == np.count_nonzero(np.linspace(10, 40, 30) > 35)
+    assert pd.isna(anomalies.loc['rain', 'Heat Stress Days'])
+
+def test_validate_data_leaves_input_unchanged():
+    """Test that validation does not write into the caller's frame"""
+    validator = DataValidator()
+    df = pd.DataFrame({
+        'date': pd.date_range('2020-01-01', periods=4),
+        'rainfall_mm': np.array([1.0, np.nan, 3.0, 4.0], dtype=np.float32)
+    })
+    data = {'test': df}
+    
+    validator.validate_data(data)
+    assert data['test']['rainfall_mm'].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert df['rainfall_mm'].isna().tolist() == [False, True, False, False]
+    
+    # The cleaned frame shares no data with the caller's frame
+    data['test'].loc[0, ['date', 'rainfall_mm']] = [pd.Timestamp('2021-01-01'), 9.0]
+    assert df.loc[0, 'date'] == pd.Timestamp('2020-01-01')
+    assert df.loc[0, 'rainfall_mm'] == 1.0
+
+def test_date_range_uses_local_days():
+    """Test that tz-aware dates are reported by their local calendar days"""
+    validator = DataValidator()
+    df = pd.DataFrame({
+        'date': pd.date_range('2020-01-01', periods=5, tz='Asia/Kolkata'),
+        'rainfall_mm': [1.0, 2.0, 3.0, 4.0, 5.0]
+    })
+    report = validator._validate_dataframe(df, 'test')
+    
+    assert report['date_range'] == '2020-01-01 to 2020-01-05'
+    assert report['checks']['date_continuity']['status']
+
+def test_validate_data_output_order(capsys):
+    """Test that each dataset's console output, errors included, stays together"""
+    validator = DataValidator()
+    dates = pd.date_range('2020-01-01', periods=3)
+    validator.validate_data({
+        'first': pd.DataFrame({'date': dates, 'rainfall_mm': [1.0, np.nan, 3.0]}),
+        'second': pd.DataFrame({'rainfall_mm': [1.0, 2.0, 3.0]})
+    })
+    
+    lines = [line for line in capsys.readouterr().out.splitlines() if line]
+    assert lines == [
+        'Validating first...',
+        'Found missing values in first:',
+        '  - rainfall_mm: 1 missing values',
+        'Attempting interpolation...',
+        'Validation completed for first: PASSED',
+        'Validating second...',
+        "Error validating second: 'date'",
+        'Validation completed for second: ERROR'
+    ]